@@ -2,3 +2,4 @@ from dstf.constraints import *
 from dstf.core import *
 from dstf.operators import *
 from dstf.properties import *
+from dstf.validators import *
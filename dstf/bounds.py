@@ -0,0 +1,427 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from math import inf
+from typing import Any, Iterator, List, Optional, Tuple
+
+from dstf.constraints import ProcessingTimesConstraint, ReleaseTimeConstraint, DeadlineConstraint, \
+    MultipurposeMachinesConstraint, ExecutionSizeConstraint, ExecutionNodesConstraint
+from dstf.core import Task, Chunk, Schedule
+from dstf.operators import AppendOperator, RemoveOperator
+from dstf.properties import ProcessedTimesProperty, CompletionTimeProperty
+
+
+class _RankNode:
+    def __init__(self, value: float):
+        self.value = value
+        self.count = 1
+        self.height = 1
+        self.size = 1
+        self.total = value
+        self.left = None
+        self.right = None
+
+
+class _RankTree:
+    def __init__(self):
+        self.root = None
+
+    def __len__(self) -> int:
+        return self._size(self.root)
+
+    def below(self, value: float) -> Tuple[int, float]:
+        root = self.root
+        size = 0
+        total = 0
+
+        while root is not None:
+            if value <= root.value:
+                root = root.left
+            else:
+                size += self._size(root.left) + root.count
+                total += self._total(root.left) + root.count * root.value
+                root = root.right
+
+        return size, total
+
+    def add(self, value: float):
+        self.root = self._add_from(self.root, value)
+
+    def _add_from(self, root: Optional["_RankNode"], value: float) -> "_RankNode":
+        if root is None:
+            return _RankNode(value)
+        elif value < root.value:
+            root.left = self._add_from(root.left, value)
+        elif value > root.value:
+            root.right = self._add_from(root.right, value)
+        else:
+            root.count += 1
+
+        return self._rotate(root)
+
+    def remove(self, value: float):
+        self.root = self._remove_from(self.root, value)
+
+    def _remove_from(self, root: Optional["_RankNode"], value: float) -> Optional["_RankNode"]:
+        if root is None:
+            return None
+        elif value < root.value:
+            root.left = self._remove_from(root.left, value)
+        elif value > root.value:
+            root.right = self._remove_from(root.right, value)
+        elif root.count > 1:
+            root.count -= 1
+        elif root.left is None:
+            return root.right
+        elif root.right is None:
+            return root.left
+        else:
+            successor = root.right
+
+            while successor.left is not None:
+                successor = successor.left
+
+            root.value = successor.value
+            root.count = successor.count
+            root.right = self._remove_min_from(root.right)
+
+        return self._rotate(root)
+
+    def _remove_min_from(self, root: "_RankNode") -> Optional["_RankNode"]:
+        if root.left is None:
+            return root.right
+        else:
+            root.left = self._remove_min_from(root.left)
+
+            return self._rotate(root)
+
+    def _rotate(self, root: "_RankNode") -> "_RankNode":
+        self._update(root)
+
+        balance = self._height(root.left) - self._height(root.right)
+
+        if balance > 1:
+            if self._height(root.left.left) < self._height(root.left.right):
+                root.left = self._rotate_left(root.left)
+
+            return self._rotate_right(root)
+        elif balance < -1:
+            if self._height(root.right.right) < self._height(root.right.left):
+                root.right = self._rotate_right(root.right)
+
+            return self._rotate_left(root)
+        else:
+            return root
+
+    def _rotate_left(self, root: "_RankNode") -> "_RankNode":
+        pivot = root.right
+
+        root.right = pivot.left
+        pivot.left = root
+
+        self._update(root)
+        self._update(pivot)
+
+        return pivot
+
+    def _rotate_right(self, root: "_RankNode") -> "_RankNode":
+        pivot = root.left
+
+        root.left = pivot.right
+        pivot.right = root
+
+        self._update(root)
+        self._update(pivot)
+
+        return pivot
+
+    def _update(self, root: "_RankNode"):
+        root.height = 1 + max(self._height(root.left), self._height(root.right))
+        root.size = root.count + self._size(root.left) + self._size(root.right)
+        root.total = root.count * root.value + self._total(root.left) + self._total(root.right)
+
+    def _height(self, root: Optional["_RankNode"]) -> int:
+        return 0 if root is None else root.height
+
+    def _size(self, root: Optional["_RankNode"]) -> int:
+        return 0 if root is None else root.size
+
+    def _total(self, root: Optional["_RankNode"]) -> float:
+        return 0 if root is None else root.total
+
+
+class LowerBounds:
+    def __init__(self, schedule: "Schedule", tasks: List["Task"], nodes: List[Any]):
+        self.schedule = schedule
+        self.nodes = list(nodes)
+        self.tasks = [task for task in tasks if ProcessingTimesConstraint in task]
+
+        self.processed = {}
+        self.remaining = {}
+        self.sizes = {}
+        self.releases = {}
+        self.deadlines = {}
+        self.dedicated = {}
+        self.completions = {}
+
+        self.work = 0
+        self.busytotal = 0
+        self.busy = {node: 0 for node in self.nodes}
+        self.loads = {node: 0 for node in self.nodes}
+        self.frontiers = {node: -inf for node in self.nodes}
+        self.cmax = 0
+
+        self.heap = []
+        self.loadheap = [(0, id(node), node) for node in self.nodes]
+        self.frontierheap = []
+        self.heads = 0
+        self.rems = _RankTree()
+        self.srpt = 0
+        self.finished = 0
+        self.times = {node: set() for node in self.nodes}
+        self.required = {node: {} for node in self.nodes}
+        self.pending = {node: 0 for node in self.nodes}
+        self.overloads = {}
+
+        for task in self.tasks:
+            self.processed[task] = {}
+            self.sizes[task] = task[ExecutionSizeConstraint].execution_size if ExecutionSizeConstraint in task else 1
+            self.releases[task] = task[ReleaseTimeConstraint].release_time if ReleaseTimeConstraint in task else 0
+            self.deadlines[task] = task[DeadlineConstraint].deadline if DeadlineConstraint in task else inf
+            self.dedicated[task] = self._dedicated(task)
+            self.remaining[task] = 0
+
+            if self.dedicated[task] in self.times:
+                self.times[self.dedicated[task]].update({self.releases[task], self.deadlines[task]} - {inf})
+
+        for node in self.nodes:
+            self.times[node] = sorted(self.times[node])
+
+        for task in self.tasks:
+            self._set_remaining(task, self._remaining(task))
+
+        for task in self.schedule.tasks():
+            for chk in self.schedule.task(task):
+                self._add(chk)
+
+    def _dedicated(self, task: "Task") -> Optional[Any]:
+        if ExecutionNodesConstraint in task:
+            nodes = task[ExecutionNodesConstraint].execution_nodes
+        elif MultipurposeMachinesConstraint in task:
+            nodes = task[MultipurposeMachinesConstraint].compatible_nodes
+        else:
+            nodes = list(task[ProcessingTimesConstraint].processing_times)
+
+        if len(nodes) == 1:
+            return nodes[0]
+        else:
+            return None
+
+    def _remaining(self, task: "Task") -> float:
+        processed = self.processed[task]
+        processing_times = task[ProcessingTimesConstraint].processing_times
+
+        return max(0, min(ptime - processed.get(node, 0) for node, ptime in processing_times.items()))
+
+    def _set_remaining(self, task: "Task", remaining: float):
+        previous = self.remaining[task]
+        size = self.sizes[task]
+        node = self.dedicated[task]
+
+        self.work += (remaining - previous) * size
+
+        if node is not None and node in self.loads:
+            self.loads[node] += remaining - previous
+            self.pending[node] += (remaining > 0) - (previous > 0)
+
+            self._push_load(node)
+
+            release = self.releases[task]
+            deadline = self.deadlines[task]
+
+            for lo, hi in self._intervals(node, deadline - max(remaining, previous),
+                                          release + max(remaining, previous)):
+                self._charge(node, lo, hi, self._mandatory(release, deadline, remaining, lo, hi)
+                             - self._mandatory(release, deadline, previous, lo, hi))
+
+        if previous > 0:
+            self._srpt_remove(previous)
+
+            self.heads -= self.releases[task] + previous
+
+        if remaining > 0:
+            self._srpt_insert(remaining)
+
+            self.heads += self.releases[task] + remaining
+
+            heapq.heappush(self.heap, (-(self.releases[task] + remaining), id(task), task, remaining))
+
+        self.remaining[task] = remaining
+
+    def _srpt_insert(self, remaining: float):
+        i, below = self.rems.below(remaining)
+
+        self.srpt += below + (len(self.rems) + 1 - i) * remaining
+
+        self.rems.add(remaining)
+
+    def _srpt_remove(self, remaining: float):
+        self.rems.remove(remaining)
+
+        i, below = self.rems.below(remaining)
+
+        self.srpt -= below + (len(self.rems) + 1 - i) * remaining
+
+    def _intervals(self, node: Any, start: float, end: float) -> Iterator[Tuple[float, float]]:
+        times = self.times[node]
+
+        for i in range(bisect_left(times, end)):
+            for j in range(max(i + 1, bisect_right(times, start)), len(times)):
+                yield times[i], times[j]
+
+    def _mandatory(self, release: float, deadline: float, remaining: float, lo: float, hi: float) -> float:
+        return max(0, min(remaining, hi - lo, release + remaining - lo, hi - deadline + remaining))
+
+    def _charge(self, node: Any, lo: float, hi: float, amount: float):
+        if amount != 0:
+            required = self.required[node]
+            before = required.get((lo, hi), 0)
+            after = before + amount
+
+            required[(lo, hi)] = after
+
+            overload = (after - (hi - lo) > self.schedule.epsilon) - (before - (hi - lo) > self.schedule.epsilon)
+
+            if overload != 0:
+                self.overloads[node] = self.overloads.get(node, 0) + overload
+
+                if self.overloads[node] == 0:
+                    del self.overloads[node]
+
+    def _busy(self, node: Any, chunk: "Chunk", sign: int):
+        start_time = chunk.start_time
+        completion_time = chunk.completion_time(node)
+
+        for lo, hi in self._intervals(node, start_time, completion_time):
+            self._charge(node, lo, hi, sign * (min(hi, completion_time) - max(lo, start_time)))
+
+    def _push_load(self, node: Any):
+        heapq.heappush(self.loadheap, (-(self.busy[node] + self.loads[node]), id(node), node))
+
+    def _push_frontier(self, node: Any):
+        heapq.heappush(self.frontierheap, (-self.frontiers[node], id(node), node))
+
+    def _add(self, chunk: "Chunk"):
+        for node, ptime in chunk.proctimes.items():
+            if node in self.busy:
+                self.busy[node] += ptime
+                self.busytotal += ptime
+
+                self._push_load(node)
+                self._busy(node, chunk, 1)
+
+                if chunk.completion_time(node) > self.frontiers[node]:
+                    self.frontiers[node] = chunk.completion_time(node)
+
+                    self._push_frontier(node)
+
+            self.cmax = max(self.cmax, chunk.completion_time(node))
+
+        self._update(chunk.task)
+
+    def _update(self, task: "Task"):
+        if task in self.processed:
+            if self.remaining[task] == 0 and task in self.completions:
+                self.finished -= self.completions[task]
+
+            self.processed[task] = self.schedule.get(ProcessedTimesProperty(task)) or {}
+
+            if self.schedule.task(task):
+                self.completions[task] = self.schedule.get(CompletionTimeProperty(task))
+            else:
+                self.completions.pop(task, None)
+
+            self._set_remaining(task, self._remaining(task))
+
+            if self.remaining[task] == 0 and task in self.completions:
+                self.finished += self.completions[task]
+
+    def append(self, chunk: "Chunk"):
+        self.schedule.apply(AppendOperator(chunk))
+
+        self._add(chunk)
+
+    def remove(self, chunk: "Chunk"):
+        self.schedule.apply(RemoveOperator(chunk))
+
+        for node, ptime in chunk.proctimes.items():
+            if node in self.busy:
+                self.busy[node] -= ptime
+                self.busytotal -= ptime
+
+                self._push_load(node)
+                self._busy(node, chunk, -1)
+
+                if chunk.completion_time(node) >= self.frontiers[node]:
+                    tree = self.schedule.node(node)
+                    self.frontiers[node] = -inf if tree is None or tree.root is None else tree.root.hi
+
+                    self._push_frontier(node)
+
+            if chunk.completion_time(node) >= self.cmax:
+                self.cmax = max(0, self._frontier())
+
+        self._update(chunk.task)
+
+    def _head(self) -> float:
+        while self.heap:
+            head, _, task, remaining = self.heap[0]
+
+            if self.remaining[task] == remaining:
+                return -head
+            else:
+                heapq.heappop(self.heap)
+
+        return 0
+
+    def makespan(self) -> float:
+        if not self.nodes:
+            return self.cmax
+
+        work = self.work + self.busytotal
+
+        return max(self.cmax, self._head(), work / len(self.nodes), self.load(), self.energy())
+
+    def _frontier(self) -> float:
+        while self.frontierheap:
+            frontier, _, node = self.frontierheap[0]
+
+            if self.frontiers[node] == -frontier:
+                return -frontier
+            else:
+                heapq.heappop(self.frontierheap)
+
+        return 0
+
+    def load(self) -> float:
+        while self.loadheap:
+            load, _, node = self.loadheap[0]
+
+            if self.busy[node] + self.loads[node] == -load:
+                return -load
+            else:
+                heapq.heappop(self.loadheap)
+
+        return 0
+
+    def total_completion_time(self) -> float:
+        if not self.nodes:
+            return self.finished
+
+        return self.finished + max(self.srpt / len(self.nodes), self.heads)
+
+    def energy(self) -> float:
+        for node in self.overloads:
+            if self.pending[node] > 0:
+                return inf
+
+        return 0
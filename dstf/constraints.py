@@ -1,6 +1,6 @@
 from typing import Any, List, Dict
 
-from dstf.core import EPSILON, Constraint, Schedule, Chunk
+from dstf.core import Constraint, Schedule, Task, Chunk
 
 
 class NoSimultaneousExecutionConstraint(Constraint):
@@ -29,7 +29,7 @@ class NoMigrationConstraint(Constraint):
         return True
 
     def geterror(self, schedule: "Schedule", chunk: "Chunk") -> str:
-        pass
+        return "'{}' task cannot migrate to {}".format(chunk.task.name, list(chunk.proctimes))
 
 
 class ProcessingTimesConstraint(Constraint):
@@ -45,7 +45,7 @@ class ProcessingTimesConstraint(Constraint):
                     if node in chk.proctimes:
                         processed += chk.proctimes[node]
 
-            if ptime - (self.processing_times[node] - processed) > EPSILON:
+            if ptime - (self.processing_times[node] - processed) > schedule.epsilon:
                 return False
 
         return True
@@ -115,3 +115,45 @@ class ExecutionNodesConstraint(Constraint):
 
     def geterror(self, schedule: "Schedule", chunk: "Chunk") -> str:
         return "'{}' task should be processed by {}".format(chunk.task.name, self.execution_nodes)
+
+
+class SetupTimeConstraint(Constraint):
+    def __init__(self, family: Any, setup_times: Dict[Any, Dict[Any, float]]):
+        self.family = family
+        self.setup_times = setup_times
+
+    def setup_time(self, prev_task: "Task", next_task: "Task") -> float:
+        if SetupTimeConstraint in prev_task and SetupTimeConstraint in next_task:
+            prev_family = prev_task[SetupTimeConstraint].family
+            next_family = next_task[SetupTimeConstraint].family
+
+            if prev_family in self.setup_times:
+                return self.setup_times[prev_family].get(next_family, 0)
+
+        return 0
+
+    def isvalid(self, schedule: "Schedule", chunk: "Chunk") -> bool:
+        for node in chunk.proctimes:
+            if schedule.hasnode(node):
+                tree = schedule.node(node)
+
+                prev = tree.predecessor(chunk.start_time)
+
+                if prev is not None:
+                    setup_time = self.setup_time(prev.chunk.task, chunk.task)
+
+                    if prev.chunk.completion_time(node) + setup_time > chunk.start_time:
+                        return False
+
+                succ = tree.successor(chunk.start_time)
+
+                if succ is not None:
+                    setup_time = self.setup_time(chunk.task, succ.chunk.task)
+
+                    if chunk.completion_time(node) + setup_time > succ.chunk.start_time:
+                        return False
+
+        return True
+
+    def geterror(self, schedule: "Schedule", chunk: "Chunk") -> str:
+        return "'{}' task cannot run without setup time on {}".format(chunk.task.name, list(chunk.proctimes))
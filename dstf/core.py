@@ -1,7 +1,10 @@
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
+from contextlib import nullcontext
+from threading import Lock, RLock
 from math import inf
-from typing import Iterator, Any, List, Dict, Type, Optional
+from numbers import Integral
+from typing import Iterator, Any, List, Dict, Type, Optional, Hashable, Tuple
 
 EPSILON = 1e-4
 
@@ -14,6 +17,10 @@ class ConstraintError(Error):
     pass
 
 
+class ResolutionError(Error):
+    pass
+
+
 class Constraint(metaclass=ABCMeta):
     @abstractmethod
     def isvalid(self, schedule: "Schedule", chunk: "Chunk") -> bool:
@@ -28,6 +35,12 @@ class Property(metaclass=ABCMeta):
     def get(self, schedule: "Schedule") -> Any:
         pass
 
+    def key(self) -> Optional[Hashable]:
+        return None
+
+    def version(self, schedule: "Schedule") -> Hashable:
+        return schedule.version
+
 
 class Operator(metaclass=ABCMeta):
     @abstractmethod
@@ -50,6 +63,9 @@ class Task:
         return self.constraints[constraint_cls]
 
     def __getattr__(self, attr: str):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+
         for ctr in self.constraints.values():
             if attr in ctr.__dict__:
                 return ctr.__dict__[attr]
@@ -81,41 +97,71 @@ class Chunk:
 
         return True
 
+    def isexact(self) -> bool:
+        if not isinstance(self.start_time, Integral):
+            return False
+
+        for ptime in self.proctimes.values():
+            if not isinstance(ptime, Integral):
+                return False
+
+        return True
+
     def append_to(self, schedule: "Schedule"):
-        for ctr in self.task.constraints.values():
-            if not ctr.isvalid(schedule, self):
-                raise ConstraintError(ctr.geterror(schedule, self))
+        with schedule.lock:
+            if schedule.resolution is not None and not self.isexact():
+                raise ResolutionError("'{}' task times should be integer ticks".format(self.task.name))
 
-        if self.task in schedule.taskmap:
-            schedule.taskmap[self.task].append(self)
-        else:
-            schedule.taskmap[self.task] = [self]
+            for ctr in self.task.constraints.values():
+                if not ctr.isvalid(schedule, self):
+                    raise ConstraintError(ctr.geterror(schedule, self))
 
-        for node in self.proctimes:
-            if node in schedule.nodemap:
-                schedule.nodemap[node].add(self)
+            if self.task in schedule.taskmap:
+                if schedule.concurrent:
+                    schedule.taskmap[self.task] = schedule.taskmap[self.task] + [self]
+                else:
+                    schedule.taskmap[self.task].append(self)
             else:
-                schedule.nodemap[node] = ChunkTree(node).add(self)
+                schedule.taskmap[self.task] = [self]
+
+            for node in self.proctimes:
+                if node in schedule.nodemap:
+                    schedule.nodemap[node].add(self)
+                else:
+                    schedule.nodemap[node] = ChunkTree(node, schedule.concurrent).add(self)
+
+            schedule.touch(self)
 
     def remove_from(self, schedule: "Schedule"):
-        schedule.taskmap[self.task].remove(self)
+        with schedule.lock:
+            if schedule.concurrent:
+                chks = schedule.taskmap[self.task].copy()
+                chks.remove(self)
+
+                schedule.taskmap[self.task] = chks
+            else:
+                schedule.taskmap[self.task].remove(self)
+
+            for node in self.proctimes:
+                schedule.nodemap[node].remove(self)
 
-        for node in self.proctimes:
-            schedule.nodemap[node].remove(self)
+            schedule.touch(self)
 
 
 class ChunkNode:
     def __init__(self, chunk: "Chunk"):
         self.chunk = chunk
         self.height = 1
+        self.lo = inf
         self.hi = -inf
         self.left = None
         self.right = None
 
 
 class ChunkTree:
-    def __init__(self, node: Any):
+    def __init__(self, node: Any, persistent: bool = False):
         self.node = node
+        self.persistent = persistent
         self.root = None
 
     def __iter__(self) -> Optional[Iterator["ChunkNode"]]:
@@ -129,6 +175,17 @@ class ChunkTree:
             yield root
             yield from self._iter_from(root.right)
 
+    def after(self, time: float) -> Iterator["ChunkNode"]:
+        return self._after_from(self.root, time)
+
+    def _after_from(self, root: Optional["ChunkNode"], time: float) -> Iterator["ChunkNode"]:
+        if root is not None:
+            if root.chunk.start_time > time:
+                yield from self._after_from(root.left, time)
+                yield root
+
+            yield from self._after_from(root.right, time)
+
     def at(self, time: float) -> List["ChunkNode"]:
         nodes = []
 
@@ -144,7 +201,8 @@ class ChunkTree:
             if root.chunk.start_time <= time < root.chunk.completion_time(self.node):
                 nodes.append(root)
 
-            self._at_from(root.right, time, nodes)
+            if root.chunk.start_time <= time:
+                self._at_from(root.right, time, nodes)
 
     def over(self, lo: float, hi: float) -> List["ChunkNode"]:
         nodes = []
@@ -161,7 +219,102 @@ class ChunkTree:
             if lo < root.chunk.completion_time(self.node) and root.chunk.start_time < hi:
                 nodes.append(root)
 
-            self._over_from(root.right, lo, hi, nodes)
+            if root.chunk.start_time < hi:
+                self._over_from(root.right, lo, hi, nodes)
+
+    def segments(self, lo: float, hi: float, width: float = 0) -> List[Tuple[float, float]]:
+        segments = []
+
+        self._segments_from(self.root, lo, hi, width, segments)
+
+        return segments
+
+    def _segments_from(self, root: Optional["ChunkNode"], lo: float, hi: float, width: float,
+                       segments: List[Tuple[float, float]]):
+        if root is not None and lo < root.hi and root.lo < hi:
+            if lo < root.lo and root.hi < hi and root.hi - root.lo <= width:
+                self._segment(root.lo, root.hi, width, segments)
+            else:
+                self._segments_from(root.left, lo, hi, width, segments)
+
+                start_time = root.chunk.start_time
+                completion_time = root.chunk.completion_time(self.node)
+
+                if lo < completion_time and start_time < hi:
+                    self._segment(max(lo, start_time), min(hi, completion_time), width, segments)
+
+                self._segments_from(root.right, lo, hi, width, segments)
+
+    def _segment(self, start: float, end: float, width: float, segments: List[Tuple[float, float]]):
+        if segments and start - segments[-1][1] <= width:
+            if end > segments[-1][1]:
+                segments[-1] = (segments[-1][0], end)
+        else:
+            segments.append((start, end))
+
+    def copy(self) -> "ChunkTree":
+        tree = ChunkTree(self.node, self.persistent)
+
+        if self.persistent:
+            tree.root = self.root
+        else:
+            tree.root = self._copy_from(self.root)
+
+        return tree
+
+    def _copy_from(self, root: Optional["ChunkNode"]) -> Optional["ChunkNode"]:
+        if root is None:
+            return None
+        else:
+            treenode = ChunkNode(root.chunk)
+
+            treenode.height = root.height
+            treenode.lo = root.lo
+            treenode.hi = root.hi
+            treenode.left = self._copy_from(root.left)
+            treenode.right = self._copy_from(root.right)
+
+            return treenode
+
+    def _mutable(self, root: "ChunkNode") -> "ChunkNode":
+        if self.persistent:
+            treenode = ChunkNode(root.chunk)
+
+            treenode.height = root.height
+            treenode.lo = root.lo
+            treenode.hi = root.hi
+            treenode.left = root.left
+            treenode.right = root.right
+
+            return treenode
+        else:
+            return root
+
+    def predecessor(self, time: float) -> Optional["ChunkNode"]:
+        current = self.root
+        found = None
+
+        while current is not None:
+            if current.chunk.start_time < time:
+                found = current
+                current = current.right
+            else:
+                current = current.left
+
+        return found
+
+    def successor(self, time: float) -> Optional["ChunkNode"]:
+        current = self.root
+        found = None
+
+        while current is not None:
+            if current.chunk.start_time > time:
+                found = current
+                current = current.left
+            else:
+                current = current.right
+
+        return found
 
     def add(self, chunk: "Chunk") -> "ChunkTree":
         self.root = self._add_from(self.root, chunk)
@@ -172,16 +325,20 @@ class ChunkTree:
         if root is None:
             treenode = ChunkNode(chunk)
 
+            treenode.lo = chunk.start_time
             treenode.hi = chunk.completion_time(self.node)
 
             return treenode
         else:
+            root = self._mutable(root)
+
             if chunk.start_time < root.chunk.start_time:
                 root.left = self._add_from(root.left, chunk)
             else:
                 root.right = self._add_from(root.right, chunk)
 
             root.height = 1 + max(self._height(root.left), self._height(root.right))
+            root.lo = min(self._lo(root), chunk.start_time)
             root.hi = max(self._hi(root), chunk.completion_time(self.node))
 
             return self._rotate(root)
@@ -195,10 +352,17 @@ class ChunkTree:
         if root is None:
             return None
         else:
+            root = self._mutable(root)
+
             if chunk.start_time < root.chunk.start_time:
                 root.left = self._remove_from(root.left, chunk)
             elif chunk.start_time > root.chunk.start_time:
                 root.right = self._remove_from(root.right, chunk)
+            elif root.chunk is not chunk:
+                if self._has_from(root.left, chunk):
+                    root.left = self._remove_from(root.left, chunk)
+                else:
+                    root.right = self._remove_from(root.right, chunk)
             else:
                 if root.left is None:
                     return root.right
@@ -212,10 +376,21 @@ class ChunkTree:
                     root.right = self._remove_from(root.right, successor.chunk)
 
             root.height = 1 + max(self._height(root.left), self._height(root.right))
+            root.lo = min(root.chunk.start_time, self._lo(root.left))
             root.hi = max(root.chunk.completion_time(self.node), self._hi(root.left), self._hi(root.right))
 
             return self._rotate(root)
 
+    def _has_from(self, root: Optional["ChunkNode"], chunk: "Chunk") -> bool:
+        if root is None:
+            return False
+        elif chunk.start_time < root.chunk.start_time:
+            return self._has_from(root.left, chunk)
+        elif chunk.start_time > root.chunk.start_time:
+            return self._has_from(root.right, chunk)
+        else:
+            return root.chunk is chunk or self._has_from(root.left, chunk) or self._has_from(root.right, chunk)
+
     def _rotate(self, root: "ChunkNode") -> "ChunkNode":
         balance = self._balance(root)
 
@@ -235,31 +410,37 @@ class ChunkTree:
             return root
 
     def _rotate_left(self, root: "ChunkNode") -> "ChunkNode":
-        pivot = root.right
+        root = self._mutable(root)
+        pivot = self._mutable(root.right)
         child = pivot.left
 
         pivot.left = root
         root.right = child
 
         root.height = 1 + max(self._height(root.left), self._height(root.right))
+        root.lo = min(root.chunk.start_time, self._lo(root.left))
         root.hi = max(root.chunk.completion_time(self.node), self._hi(root.left), self._hi(root.right))
 
         pivot.height = 1 + max(self._height(pivot.left), self._height(pivot.right))
+        pivot.lo = min(pivot.chunk.start_time, self._lo(pivot.left))
         pivot.hi = max(pivot.chunk.completion_time(self.node), self._hi(pivot.left), self._hi(pivot.right))
 
         return pivot
 
     def _rotate_right(self, root: "ChunkNode") -> "ChunkNode":
-        pivot = root.left
+        root = self._mutable(root)
+        pivot = self._mutable(root.left)
         child = pivot.right
 
         pivot.right = root
         root.left = child
 
         root.height = 1 + max(self._height(root.left), self._height(root.right))
+        root.lo = min(root.chunk.start_time, self._lo(root.left))
         root.hi = max(root.chunk.completion_time(self.node), self._hi(root.left), self._hi(root.right))
 
         pivot.height = 1 + max(self._height(pivot.left), self._height(pivot.right))
+        pivot.lo = min(pivot.chunk.start_time, self._lo(pivot.left))
         pivot.hi = max(pivot.chunk.completion_time(self.node), self._hi(pivot.left), self._hi(pivot.right))
 
         return pivot
@@ -276,6 +457,12 @@ class ChunkTree:
         else:
             return root.height
 
+    def _lo(self, root: Optional["ChunkNode"]) -> float:
+        if root is None:
+            return inf
+        else:
+            return root.lo
+
     def _hi(self, root: Optional["ChunkNode"]) -> float:
         if root is None:
             return -inf
@@ -312,12 +499,36 @@ class ChunkTree:
 
 
 class Schedule:
-    def __init__(self):
+    def __init__(self, cachesize: int = 1024, concurrent: bool = False, resolution: Optional[float] = None):
         self.taskmap = {}
         self.nodemap = {}
+        self.resolution = resolution
+        self.epsilon = EPSILON if resolution is None else 0
+        self.version = 0
+        self.taskversions = {}
+        self.nodeversions = {}
+        self.cachesize = cachesize
+        self.cache = OrderedDict()
+        self.concurrent = concurrent
+
+        if concurrent:
+            self.lock = RLock()
+            self.cachelock = Lock()
+        else:
+            self.lock = nullcontext()
+            self.cachelock = nullcontext()
+
+    def totick(self, time: float) -> int:
+        return round(time / self.resolution)
+
+    def fromtick(self, tick: int) -> float:
+        return tick * self.resolution
 
     def tasks(self) -> Iterator["Task"]:
-        return iter(self.taskmap)
+        if self.concurrent:
+            return iter(list(self.taskmap))
+        else:
+            return iter(self.taskmap)
 
     def hastask(self, task: "Task") -> bool:
         return task in self.taskmap
@@ -328,8 +539,14 @@ class Schedule:
         else:
             return None
 
+    def taskversion(self, task: "Task") -> int:
+        return self.taskversions.get(task, 0)
+
     def nodes(self) -> Iterator[Any]:
-        return iter(self.nodemap)
+        if self.concurrent:
+            return iter(list(self.nodemap))
+        else:
+            return iter(self.nodemap)
 
     def hasnode(self, node: Any) -> bool:
         return node in self.nodemap
@@ -340,16 +557,100 @@ class Schedule:
         else:
             return None
 
-    # def copy(self):
-    #     chunk_map = self.taskmap.copy()
-    #
-    #     for tsk in chunk_map:
-    #         chunk_map[tsk] = chunk_map[tsk].copy()
-    #
-    #     return Schedule(chunk_map)
+    def nodeversion(self, node: Any) -> int:
+        return self.nodeversions.get(node, 0)
+
+    def touch(self, chunk: "Chunk"):
+        self.version += 1
+        self.taskversions[chunk.task] = self.taskversion(chunk.task) + 1
+
+        for node in chunk.proctimes:
+            self.nodeversions[node] = self.nodeversion(node) + 1
+
+    def copy(self) -> "Schedule":
+        schedule = Schedule(self.cachesize, self.concurrent, self.resolution)
+
+        with self.lock:
+            for task, chks in self.taskmap.items():
+                if self.concurrent:
+                    schedule.taskmap[task] = chks
+                else:
+                    schedule.taskmap[task] = chks.copy()
+
+            for node, tree in self.nodemap.items():
+                schedule.nodemap[node] = tree.copy()
+
+            schedule.version = self.version
+            schedule.taskversions = self.taskversions.copy()
+            schedule.nodeversions = self.nodeversions.copy()
+
+        with self.cachelock:
+            schedule.cache = self.cache.copy()
+
+        return schedule
+
+    def diff(self, other: "Schedule") -> List["Operator"]:
+        from dstf.operators import AppendOperator, RemoveOperator
+
+        def key(chk: "Chunk") -> Any:
+            return chk.task, chk.start_time, frozenset(chk.proctimes.items())
+
+        chks = {}
+
+        for task in self.tasks():
+            for chk in self.task(task):
+                if key(chk) in chks:
+                    chks[key(chk)].append(chk)
+                else:
+                    chks[key(chk)] = [chk]
+
+        appended = []
+
+        for task in other.tasks():
+            for chk in other.task(task):
+                if chks.get(key(chk)):
+                    chks[key(chk)].pop()
+                else:
+                    appended.append(chk)
+
+        removed = [chk for same in chks.values() for chk in same]
+
+        return ([RemoveOperator(chk) for chk in removed]
+                + [AppendOperator(chk) for chk in sorted(appended, key=lambda chk: chk.start_time)])
+
+    def validate(self) -> List["Violation"]:
+        from dstf.validators import validate
+
+        return validate((chk for task in self.tasks() for chk in self.task(task)), self)
 
     def get(self, prop: "Property") -> Any:
-        return prop.get(self)
+        key = prop.key()
+
+        if key is None or self.cachesize <= 0:
+            return prop.get(self)
+
+        version = prop.version(self)
+
+        with self.cachelock:
+            if key in self.cache:
+                cached_version, value = self.cache[key]
+
+                if cached_version == version:
+                    self.cache.move_to_end(key)
+
+                    return value
+
+        value = prop.get(self)
+
+        with self.cachelock:
+            self.cache[key] = (version, value)
+            self.cache.move_to_end(key)
+
+            while len(self.cache) > self.cachesize:
+                self.cache.popitem(last=False)
+
+        return value
 
     def apply(self, operator: "Operator") -> Any:
-        return operator.apply(self)
+        with self.lock:
+            return operator.apply(self)
@@ -1,5 +1,7 @@
-from dstf.core import Operator, Schedule, Chunk
-from dstf.properties import ChunksAtProperty
+from typing import Any, List, Optional, Set
+
+from dstf.core import Property, Operator, Schedule, Chunk, ChunkNode, ChunkTree, Task
+from dstf.properties import ChunksAtProperty, ChunksOverProperty, EarliestStartTimeProperty
 
 
 class AppendOperator(Operator):
@@ -44,3 +46,109 @@ class PreemptOperator(Operator):
                     Chunk(chk.task, chk.start_time, proctimes).append_to(schedule)
 
         self.chunk.append_to(schedule)
+
+
+class _TreeView:
+    def __init__(self, tree: "ChunkTree", hidden: Set["Chunk"]):
+        self.tree = tree
+        self.hidden = hidden
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.tree, attr)
+
+    def at(self, time: float) -> List["ChunkNode"]:
+        return [treenode for treenode in self.tree.at(time) if treenode.chunk not in self.hidden]
+
+    def over(self, lo: float, hi: float) -> List["ChunkNode"]:
+        return [treenode for treenode in self.tree.over(lo, hi) if treenode.chunk not in self.hidden]
+
+    def predecessor(self, time: float) -> Optional["ChunkNode"]:
+        treenode = self.tree.predecessor(time)
+
+        while treenode is not None and treenode.chunk in self.hidden:
+            treenode = self.tree.predecessor(treenode.chunk.start_time)
+
+        return treenode
+
+    def successor(self, time: float) -> Optional["ChunkNode"]:
+        treenode = self.tree.successor(time)
+
+        while treenode is not None and treenode.chunk in self.hidden:
+            treenode = self.tree.successor(treenode.chunk.start_time)
+
+        return treenode
+
+
+class _ScheduleView:
+    def __init__(self, schedule: "Schedule", hidden: Set["Chunk"]):
+        self.schedule = schedule
+        self.hidden = hidden
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.schedule, attr)
+
+    def hastask(self, task: "Task") -> bool:
+        return bool(self.task(task))
+
+    def task(self, task: "Task") -> Optional[List["Chunk"]]:
+        chks = self.schedule.task(task)
+
+        if chks is None:
+            return None
+        else:
+            return [chk for chk in chks if chk not in self.hidden]
+
+    def node(self, node: Any) -> Optional["_TreeView"]:
+        tree = self.schedule.node(node)
+
+        if tree is None:
+            return None
+        else:
+            return _TreeView(tree, self.hidden)
+
+    def get(self, prop: "Property") -> Any:
+        return prop.get(self)
+
+
+class RepairOperator(Operator):
+    def __init__(self, lo: float, hi: float, nodes: Optional[List[Any]] = None):
+        self.lo = lo
+        self.hi = hi
+        self.nodes = nodes
+        self.unplaced = []
+
+    def apply(self, schedule: "Schedule") -> List["Operator"]:
+        chks = schedule.get(ChunksOverProperty(self.lo, self.hi, self.nodes))
+
+        lifted = []
+        hidden = set()
+        view = _ScheduleView(schedule, hidden)
+
+        for chk in sorted(chks, key=lambda chk: chk.start_time):
+            hidden.add(chk)
+
+            if chk.isvalid(view):
+                hidden.remove(chk)
+            else:
+                lifted.append(chk)
+
+        for chk in lifted:
+            chk.remove_from(schedule)
+
+        operators = [RemoveOperator(chk) for chk in lifted]
+
+        self.unplaced = []
+
+        for chk in lifted:
+            start_time = schedule.get(EarliestStartTimeProperty(chk.task, chk.proctimes, chk.start_time))
+
+            if start_time is None:
+                self.unplaced.append(chk)
+            else:
+                repaired = Chunk(chk.task, start_time, chk.proctimes)
+
+                repaired.append_to(schedule)
+
+                operators.append(AppendOperator(repaired))
+
+        return operators
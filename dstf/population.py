@@ -0,0 +1,159 @@
+from math import inf
+from numbers import Integral
+from typing import Any, List, Optional
+
+import numpy as np
+
+from dstf.constraints import ProcessingTimesConstraint, ReleaseTimeConstraint, DeadlineConstraint, \
+    MultipurposeMachinesConstraint, ExecutionSizeConstraint, ExecutionNodesConstraint
+from dstf.core import ResolutionError, Task, Chunk, Schedule
+from dstf.operators import AppendOperator
+
+
+class Evaluation:
+    def __init__(self, start_times: np.ndarray, completion_times: np.ndarray, feasible: np.ndarray):
+        self.start_times = start_times
+        self.completion_times = completion_times
+        self.feasible = feasible
+        self.makespan = completion_times.max(axis=1)
+        self.total_completion_time = completion_times.sum(axis=1)
+
+    def elite(self, size: int, objective: str = "makespan") -> np.ndarray:
+        values = np.where(self.feasible, getattr(self, objective), inf)
+
+        return np.argsort(values, kind="stable")[:size]
+
+
+class PopulationDecoder:
+    def __init__(self, tasks: List["Task"], nodes: List[Any], resolution: Optional[float] = None):
+        self.tasks = list(tasks)
+        self.nodes = list(nodes)
+        self.resolution = resolution
+
+        if resolution is None:
+            self.dtype = np.float64
+            self.lowest = -inf
+            self.highest = inf
+        else:
+            self.dtype = np.int64
+            self.lowest = np.iinfo(np.int64).min
+            self.highest = np.iinfo(np.int64).max
+
+        n = len(self.tasks)
+        m = len(self.nodes)
+        index = {node: i for i, node in enumerate(self.nodes)}
+
+        self.processing_times = np.zeros((n, m), dtype=self.dtype)
+        self.compatible = np.zeros((n, m), dtype=bool)
+        self.release_times = np.zeros(n, dtype=self.dtype)
+        self.deadlines = np.full(n, self.highest, dtype=self.dtype)
+        self.execution_sizes = np.ones(n, dtype=np.int64)
+
+        for j, task in enumerate(self.tasks):
+            if ProcessingTimesConstraint in task:
+                for node, ptime in task[ProcessingTimesConstraint].processing_times.items():
+                    if node in index:
+                        self.processing_times[j, index[node]] = self._time(task, ptime)
+                        self.compatible[j, index[node]] = True
+
+            if MultipurposeMachinesConstraint in task:
+                compatible = np.zeros(m, dtype=bool)
+
+                for node in task[MultipurposeMachinesConstraint].compatible_nodes:
+                    if node in index:
+                        compatible[index[node]] = True
+
+                self.compatible[j] &= compatible
+
+            if ExecutionNodesConstraint in task:
+                compatible = np.zeros(m, dtype=bool)
+
+                for node in task[ExecutionNodesConstraint].execution_nodes:
+                    if node in index:
+                        compatible[index[node]] = True
+
+                self.compatible[j] &= compatible
+                self.execution_sizes[j] = len(task[ExecutionNodesConstraint].execution_nodes)
+
+            if ReleaseTimeConstraint in task:
+                self.release_times[j] = self._time(task, task[ReleaseTimeConstraint].release_time)
+
+            if DeadlineConstraint in task and task[DeadlineConstraint].deadline != inf:
+                self.deadlines[j] = self._time(task, task[DeadlineConstraint].deadline)
+
+            if ExecutionSizeConstraint in task:
+                self.execution_sizes[j] = task[ExecutionSizeConstraint].execution_size
+
+    def _time(self, task: "Task", time: float) -> float:
+        if self.resolution is not None and not isinstance(time, Integral):
+            raise ResolutionError("'{}' task times should be integer ticks".format(task.name))
+
+        return time
+
+    def decode(self, permutations: np.ndarray, assignments: np.ndarray) -> "Evaluation":
+        permutations = np.asarray(permutations, dtype=np.int64)
+        assignments = np.asarray(assignments, dtype=np.int64)
+
+        if assignments.ndim == 2:
+            assignments = assignments[:, :, np.newaxis]
+
+        p, n = permutations.shape
+        k = assignments.shape[2]
+
+        if self.execution_sizes.max(initial=1) > k:
+            raise ValueError("assignments should provide {} nodes per task".format(self.execution_sizes.max()))
+
+        rows = np.arange(p)
+        columns = np.arange(k)
+        used_columns = columns[np.newaxis, :] < self.execution_sizes[:, np.newaxis]
+
+        ready = np.zeros((p, len(self.nodes)), dtype=self.dtype)
+        start_times = np.empty((p, n), dtype=self.dtype)
+        completion_times = np.empty((p, n), dtype=self.dtype)
+        feasible = np.ones(p, dtype=bool)
+
+        for position in range(n):
+            jobs = permutations[:, position]
+            used = used_columns[jobs]
+            nodes = np.where(used, assignments[rows, jobs], 0)
+
+            ptimes = np.where(used, self.processing_times[jobs[:, np.newaxis], nodes], 0)
+            node_ready = np.where(used, ready[rows[:, np.newaxis], nodes], self.lowest)
+
+            start = np.maximum(self.release_times[jobs], node_ready.max(axis=1))
+            end = start[:, np.newaxis] + ptimes
+            completion = np.where(used, end, self.lowest).max(axis=1)
+
+            for column in columns:
+                selected = used[:, column]
+
+                ready[rows[selected], nodes[selected, column]] = end[selected, column]
+
+            distinct = np.sort(np.where(used, nodes, -1 - columns), axis=1)
+
+            feasible &= (self.compatible[jobs[:, np.newaxis], nodes] | ~used).all(axis=1)
+            feasible &= (np.diff(distinct, axis=1) != 0).all(axis=1)
+            feasible &= completion <= self.deadlines[jobs]
+
+            start_times[rows, jobs] = start
+            completion_times[rows, jobs] = completion
+
+        return Evaluation(start_times, completion_times, feasible)
+
+    def schedule(self, permutation: np.ndarray, assignment: np.ndarray) -> "Schedule":
+        permutation = np.asarray(permutation, dtype=np.int64)
+        assignment = np.asarray(assignment, dtype=np.int64)
+
+        if assignment.ndim == 1:
+            assignment = assignment[:, np.newaxis]
+
+        evaluation = self.decode(permutation[np.newaxis], assignment[np.newaxis])
+        schedule = Schedule(resolution=self.resolution)
+
+        for j in permutation:
+            nodes = assignment[j, :self.execution_sizes[j]]
+            proctimes = {self.nodes[i]: self.processing_times[j, i].item() for i in nodes}
+
+            schedule.apply(AppendOperator(Chunk(self.tasks[j], evaluation.start_times[0, j].item(), proctimes)))
+
+        return schedule
@@ -1,48 +1,107 @@
-from typing import Optional, Any, Dict, Set
+import heapq
+from math import inf
+from types import MappingProxyType
+from typing import Optional, Any, Dict, List, Mapping, FrozenSet, Hashable, Iterator, Tuple
 
-from dstf.core import Property, Schedule, Task, Chunk
+from dstf.constraints import ReleaseTimeConstraint, SetupTimeConstraint
+from dstf.core import Property, Schedule, Task, Chunk, ChunkNode
 
 
-class ChunksAtProperty(Property):
-    def __init__(self, time: float):
+class NodesProperty(Property):
+    def __init__(self, nodes: Optional[List[Any]] = None):
+        self.nodes = None if nodes is None else tuple(nodes)
+
+    def version(self, schedule: "Schedule") -> Hashable:
+        if self.nodes is None:
+            return schedule.version
+        else:
+            return tuple(schedule.nodeversion(node) for node in self.nodes)
+
+    def getnodes(self, schedule: "Schedule") -> Iterator[Any]:
+        if self.nodes is None:
+            return schedule.nodes()
+        else:
+            return (node for node in self.nodes if schedule.hasnode(node))
+
+
+class ChunksAtProperty(NodesProperty):
+    def __init__(self, time: float, nodes: Optional[List[Any]] = None):
+        super().__init__(nodes)
+
         self.time = time
 
-    def get(self, schedule: "Schedule") -> Set["Chunk"]:
+    def key(self) -> Optional[Hashable]:
+        return type(self), self.time, self.nodes
+
+    def get(self, schedule: "Schedule") -> FrozenSet["Chunk"]:
         chks = set()
 
-        for node in schedule.nodes():
+        for node in self.getnodes(schedule):
             tree = schedule.node(node)
             treenodes = tree.at(self.time)
 
             for treenode in treenodes:
                 chks.add(treenode.chunk)
 
-        return chks
+        return frozenset(chks)
+
 
+class ChunksOverProperty(NodesProperty):
+    def __init__(self, lo: float, hi: float, nodes: Optional[List[Any]] = None):
+        super().__init__(nodes)
 
-class ChunksOverProperty(Property):
-    def __init__(self, lo: float, hi: float):
         self.lo = lo
         self.hi = hi
 
-    def get(self, schedule: "Schedule") -> Set["Chunk"]:
+    def key(self) -> Optional[Hashable]:
+        return type(self), self.lo, self.hi, self.nodes
+
+    def get(self, schedule: "Schedule") -> FrozenSet["Chunk"]:
         chks = set()
 
-        for node in schedule.nodes():
+        for node in self.getnodes(schedule):
             tree = schedule.node(node)
             treenodes = tree.over(self.lo, self.hi)
 
             for treenode in treenodes:
                 chks.add(treenode.chunk)
 
-        return chks
+        return frozenset(chks)
+
+
+class TimelineProperty(NodesProperty):
+    def __init__(self, lo: float, hi: float, width: float = 0, nodes: Optional[List[Any]] = None):
+        super().__init__(nodes)
+
+        self.lo = lo
+        self.hi = hi
+        self.width = width
+
+    def key(self) -> Optional[Hashable]:
+        return type(self), self.lo, self.hi, self.width, self.nodes
+
+    def get(self, schedule: "Schedule") -> Mapping[Any, Tuple[Tuple[float, float], ...]]:
+        segments = {}
+
+        for node in self.getnodes(schedule):
+            tree = schedule.node(node)
+
+            segments[node] = tuple(tree.segments(self.lo, self.hi, self.width))
+
+        return MappingProxyType(segments)
 
 
 class ProcessedTimesProperty(Property):
     def __init__(self, task: "Task"):
         self.task = task
 
-    def get(self, schedule: "Schedule") -> Optional[Dict[Any, float]]:
+    def key(self) -> Optional[Hashable]:
+        return type(self), self.task
+
+    def version(self, schedule: "Schedule") -> Hashable:
+        return schedule.taskversion(self.task)
+
+    def get(self, schedule: "Schedule") -> Optional[Mapping[Any, float]]:
         if schedule.hastask(self.task):
             processed = {}
 
@@ -53,7 +112,7 @@ class ProcessedTimesProperty(Property):
                     else:
                         processed[node] = ptime
 
-            return processed
+            return MappingProxyType(processed)
         else:
             return None
 
@@ -62,6 +121,12 @@ class StartTimeProperty(Property):
     def __init__(self, task: "Task"):
         self.task = task
 
+    def key(self) -> Optional[Hashable]:
+        return type(self), self.task
+
+    def version(self, schedule: "Schedule") -> Hashable:
+        return schedule.taskversion(self.task)
+
     def get(self, schedule: "Schedule") -> Optional[float]:
         if schedule.hastask(self.task):
             return min(chk.start_time for chk in schedule.task(self.task))
@@ -73,8 +138,83 @@ class CompletionTimeProperty(Property):
     def __init__(self, task: "Task"):
         self.task = task
 
+    def key(self) -> Optional[Hashable]:
+        return type(self), self.task
+
+    def version(self, schedule: "Schedule") -> Hashable:
+        return schedule.taskversion(self.task)
+
     def get(self, schedule: "Schedule") -> Optional[float]:
         if schedule.hastask(self.task):
             return max(max(chk.completion_time(node) for node in chk.proctimes) for chk in schedule.task(self.task))
         else:
             return None
+
+
+class EarliestStartTimeProperty(Property):
+    def __init__(self, task: "Task", proctimes: Dict[Any, float], time: float = 0):
+        self.task = task
+        self.proctimes = proctimes
+        self.time = time
+
+    def _ready(self, treenode: "ChunkNode", node: Any) -> float:
+        completion_time = treenode.chunk.completion_time(node)
+
+        if SetupTimeConstraint in self.task:
+            completion_time += self.task[SetupTimeConstraint].setup_time(treenode.chunk.task, self.task)
+
+        return completion_time
+
+    def get(self, schedule: "Schedule") -> Optional[float]:
+        time = self.time
+
+        if ReleaseTimeConstraint in self.task:
+            time = max(time, self.task[ReleaseTimeConstraint].release_time)
+
+        times = [time]
+        cursors = []
+
+        for i, node in enumerate(self.proctimes):
+            if schedule.hasnode(node):
+                tree = schedule.node(node)
+                treenodes = tree.at(time)
+
+                prev = tree.predecessor(time)
+
+                if prev is not None:
+                    treenodes.append(prev)
+
+                for treenode in treenodes:
+                    completion_time = self._ready(treenode, node)
+
+                    if completion_time > time:
+                        heapq.heappush(times, completion_time)
+
+                after = tree.after(time)
+                treenode = next(after, None)
+
+                if treenode is not None:
+                    heapq.heappush(cursors, (treenode.chunk.start_time, i, node, treenode, after))
+
+        checked = -inf
+
+        while times or cursors:
+            if cursors and (not times or cursors[0][0] < times[0]):
+                _, i, node, treenode, after = heapq.heappop(cursors)
+
+                heapq.heappush(times, self._ready(treenode, node))
+
+                treenode = next(after, None)
+
+                if treenode is not None:
+                    heapq.heappush(cursors, (treenode.chunk.start_time, i, node, treenode, after))
+            else:
+                start_time = heapq.heappop(times)
+
+                if start_time > checked:
+                    checked = start_time
+
+                    if Chunk(self.task, start_time, self.proctimes).isvalid(schedule):
+                        return start_time
+
+        return None
@@ -0,0 +1,160 @@
+import asyncio
+import random
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from dstf.core import Error, Property, Operator, Schedule
+
+
+class ScheduleService:
+    def __init__(self, schedule: "Schedule", batchsize: int = 64):
+        if not schedule.concurrent:
+            raise Error("service schedules should be concurrent so that snapshots share their trees")
+
+        self.schedule = schedule
+        self.snapshot = schedule.copy()
+        self.batchsize = batchsize
+        self.queue = None
+        self.writer = None
+
+    async def __aenter__(self) -> "ScheduleService":
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    async def start(self):
+        self.queue = asyncio.Queue()
+        self.writer = asyncio.get_running_loop().create_task(self._write())
+
+    async def stop(self):
+        if self.writer is None:
+            return
+
+        await self.queue.join()
+
+        self.writer.cancel()
+
+        try:
+            await self.writer
+        except asyncio.CancelledError:
+            pass
+
+        self.writer = None
+
+    async def get(self, prop: "Property") -> Any:
+        return self.snapshot.get(prop)
+
+    async def apply(self, operator: "Operator") -> Any:
+        future = asyncio.get_running_loop().create_future()
+
+        await self.queue.put((operator, future))
+
+        return await future
+
+    def _apply(self, batch: List[Tuple["Operator", "asyncio.Future"]]) -> Tuple[List[Tuple[Any, Any]], "Schedule"]:
+        results = []
+
+        for operator, future in batch:
+            try:
+                results.append((self.schedule.apply(operator), None))
+            except Exception as error:
+                results.append((None, error))
+
+        snapshot = self.schedule.copy()
+
+        with self.snapshot.cachelock:
+            entries = list(self.snapshot.cache.items())
+
+        for key, entry in entries:
+            if key not in snapshot.cache and len(snapshot.cache) < snapshot.cachesize:
+                snapshot.cache[key] = entry
+
+        return results, snapshot
+
+    async def _write(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self.queue.get()]
+
+            while len(batch) < self.batchsize and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            results, self.snapshot = await loop.run_in_executor(None, self._apply, batch)
+
+            for (operator, future), (result, error) in zip(batch, results):
+                if not future.cancelled():
+                    if error is None:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(error)
+
+                self.queue.task_done()
+
+
+class LoadReport:
+    def __init__(self, latencies: List[float], errors: int, elapsed: float):
+        self.latencies = sorted(latencies)
+        self.requests = len(latencies)
+        self.errors = errors
+        self.elapsed = elapsed
+        self.rps = self.requests / elapsed if elapsed > 0 else 0
+
+    def percentile(self, q: float) -> Optional[float]:
+        if self.requests == 0:
+            return None
+        else:
+            return self.latencies[min(self.requests - 1, int(q * self.requests))]
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.percentile(0.5)
+
+    @property
+    def p99(self) -> Optional[float]:
+        return self.percentile(0.99)
+
+    def __repr__(self) -> str:
+        return "LoadReport(requests={}, errors={}, rps={:.1f}, p50={}, p99={})".format(self.requests, self.errors,
+                                                                                      self.rps, self.p50, self.p99)
+
+
+async def generate_load(service: "ScheduleService",
+                        read: Callable[[int], "Property"],
+                        write: Callable[[int], "Operator"],
+                        requests: int = 10000,
+                        concurrency: int = 64,
+                        write_ratio: float = 0.1,
+                        seed: Optional[int] = None) -> "LoadReport":
+    rng = random.Random(seed)
+    kinds = [rng.random() < write_ratio for _ in range(requests)]
+    counter = iter(range(requests))
+    latencies = []
+    errors = 0
+
+    async def client():
+        nonlocal errors
+
+        for i in counter:
+            begin = time.perf_counter()
+
+            try:
+                if kinds[i]:
+                    await service.apply(write(i))
+                else:
+                    await service.get(read(i))
+            except Exception:
+                errors += 1
+
+            latencies.append(time.perf_counter() - begin)
+
+            await asyncio.sleep(0)
+
+    begin = time.perf_counter()
+
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+
+    return LoadReport(latencies, errors, time.perf_counter() - begin)
@@ -0,0 +1,366 @@
+import multiprocessing
+import os
+from itertools import count
+from typing import Any, List, Dict, Iterator, Optional, Tuple
+
+from dstf.constraints import NoSimultaneousExecutionConstraint, SetupTimeConstraint, ReleaseTimeConstraint, \
+    MultipurposeMachinesConstraint, ExecutionNodesConstraint
+from dstf.core import EPSILON, Error, ConstraintError, ResolutionError, Constraint, Property, Operator, Task, Chunk, \
+    ChunkTree, Schedule
+from dstf.operators import AppendOperator, RemoveOperator
+from dstf.properties import ChunksAtProperty, ChunksOverProperty, ProcessedTimesProperty, StartTimeProperty, \
+    CompletionTimeProperty, EarliestStartTimeProperty
+
+NODE_CONSTRAINTS = (NoSimultaneousExecutionConstraint, SetupTimeConstraint)
+
+
+class ShardError(Error):
+    pass
+
+
+class _Shard:
+    def __init__(self, nodes: List[Any], resolution: Optional[float]):
+        self.schedule = Schedule(resolution=resolution)
+        self.tasks = {}
+        self.taskids = {}
+        self.pending = {}
+
+        for node in nodes:
+            self.schedule.nodemap[node] = ChunkTree(node)
+
+    def task(self, taskid: int, name: str, constraints: List["Constraint"]) -> "Task":
+        if taskid not in self.tasks:
+            self.tasks[taskid] = Task(name)
+            self.taskids[self.tasks[taskid]] = taskid
+
+        task = self.tasks[taskid]
+
+        for ctr in constraints:
+            task.set(ctr)
+
+        return task
+
+    def find(self, taskid: int, start_time: float, proctimes: Dict[Any, float]) -> Optional["Chunk"]:
+        if taskid in self.tasks and self.schedule.hastask(self.tasks[taskid]):
+            for chk in self.schedule.task(self.tasks[taskid]):
+                if chk.start_time == start_time and chk.proctimes == proctimes:
+                    return chk
+
+        return None
+
+    def reserve(self, txid: int, taskid: int, name: str, constraints: List["Constraint"], start_time: float,
+                proctimes: Dict[Any, float]) -> Optional[str]:
+        chunk = Chunk(self.task(taskid, name, constraints), start_time, proctimes)
+
+        try:
+            chunk.append_to(self.schedule)
+        except ConstraintError as error:
+            return str(error)
+
+        self.pending[txid] = chunk
+
+        return None
+
+    def commit(self, txid: int):
+        del self.pending[txid]
+
+    def abort(self, txid: int):
+        chunk = self.pending.pop(txid, None)
+
+        if chunk is not None:
+            chunk.remove_from(self.schedule)
+
+    def remove(self, taskid: int, start_time: float, proctimes: Dict[Any, float]):
+        chunk = self.find(taskid, start_time, proctimes)
+
+        if chunk is not None:
+            chunk.remove_from(self.schedule)
+
+    def earliest(self, taskid: int, name: str, constraints: List["Constraint"], proctimes: Dict[Any, float],
+                 time: float) -> Optional[float]:
+        return self.schedule.get(EarliestStartTimeProperty(self.task(taskid, name, constraints), proctimes, time))
+
+    def slots(self, taskid: int, name: str, constraints: List["Constraint"], ptime: float, nodes: List[Any],
+              time: float) -> List[Tuple[float, Any]]:
+        task = self.task(taskid, name, constraints)
+        slots = []
+
+        for node in nodes:
+            start_time = EarliestStartTimeProperty(task, {node: ptime}, time).get(self.schedule)
+
+            if start_time is not None:
+                slots.append((start_time, node))
+
+        return slots
+
+    def chunks(self, prop: "Property") -> List[Tuple[int, float, Any]]:
+        return [(self.taskids[chk.task], chk.start_time, next(iter(chk.proctimes))) for chk in self.schedule.get(prop)]
+
+
+def _serve(conn, nodes: List[Any], resolution: Optional[float]):
+    shard = _Shard(nodes, resolution)
+
+    while True:
+        method, args = conn.recv()
+
+        if method is None:
+            break
+
+        try:
+            conn.send((True, getattr(shard, method)(*args)))
+        except Exception as error:
+            conn.send((False, error))
+
+    conn.close()
+
+
+class ShardedSchedule:
+    def __init__(self, nodes: List[Any], shards: Optional[int] = None, resolution: Optional[float] = None):
+        if shards is None:
+            shards = os.cpu_count() or 1
+
+        self.resolution = resolution
+        self.epsilon = EPSILON if resolution is None else 0
+        self.shardmap = {node: i % shards for i, node in enumerate(nodes)}
+        self.taskmap = {}
+        self.taskids = {}
+        self.chunkmap = {}
+        self.txids = count()
+        self.conns = []
+        self.processes = []
+
+        for shard in range(shards):
+            conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve,
+                                              args=(child_conn, [node for node in nodes
+                                                                 if self.shardmap[node] == shard], resolution),
+                                              daemon=True)
+
+            process.start()
+            child_conn.close()
+
+            self.conns.append(conn)
+            self.processes.append(process)
+
+    def __enter__(self) -> "ShardedSchedule":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        for conn, process in zip(self.conns, self.processes):
+            conn.send((None, ()))
+            process.join()
+            conn.close()
+
+        self.conns = []
+        self.processes = []
+
+    def _call(self, calls: Dict[int, Tuple[str, tuple]]) -> Dict[int, Any]:
+        for shard, call in calls.items():
+            self.conns[shard].send(call)
+
+        results = {}
+        error = None
+
+        for shard in calls:
+            ok, result = self.conns[shard].recv()
+
+            if ok:
+                results[shard] = result
+            elif error is None:
+                error = result
+
+        if error is not None:
+            raise ShardError("shard failed: {!r}".format(error))
+
+        return results
+
+    def _split(self, proctimes: Dict[Any, float]) -> Dict[int, Dict[Any, float]]:
+        parts = {}
+
+        for node, ptime in proctimes.items():
+            shard = self.shardmap[node]
+
+            if shard in parts:
+                parts[shard][node] = ptime
+            else:
+                parts[shard] = {node: ptime}
+
+        return parts
+
+    def _taskid(self, task: "Task") -> int:
+        if task not in self.taskids:
+            self.taskids[task] = len(self.taskids)
+
+        return self.taskids[task]
+
+    def _node_constraints(self, task: "Task") -> List["Constraint"]:
+        return [ctr for ctr in task.constraints.values() if isinstance(ctr, NODE_CONSTRAINTS)]
+
+    def _isvalid(self, chunk: "Chunk") -> Optional["Constraint"]:
+        for ctr in chunk.task.constraints.values():
+            if not isinstance(ctr, NODE_CONSTRAINTS) and not ctr.isvalid(self, chunk):
+                return ctr
+
+        return None
+
+    def tasks(self) -> Iterator["Task"]:
+        return iter(self.taskmap)
+
+    def hastask(self, task: "Task") -> bool:
+        return task in self.taskmap
+
+    def task(self, task: "Task") -> Optional[List["Chunk"]]:
+        if task in self.taskmap:
+            return self.taskmap[task]
+        else:
+            return None
+
+    def nodes(self) -> Iterator[Any]:
+        return iter(self.shardmap)
+
+    def hasnode(self, node: Any) -> bool:
+        return node in self.shardmap
+
+    def append(self, chunk: "Chunk"):
+        if self.resolution is not None and not chunk.isexact():
+            raise ResolutionError("'{}' task times should be integer ticks".format(chunk.task.name))
+
+        ctr = self._isvalid(chunk)
+
+        if ctr is not None:
+            raise ConstraintError(ctr.geterror(self, chunk))
+
+        txid = next(self.txids)
+        taskid = self._taskid(chunk.task)
+        constraints = self._node_constraints(chunk.task)
+        parts = self._split(chunk.proctimes)
+
+        committed = False
+
+        try:
+            errors = self._call({shard: ("reserve", (txid, taskid, chunk.task.name, constraints, chunk.start_time,
+                                                     proctimes))
+                                 for shard, proctimes in parts.items()})
+
+            for error in errors.values():
+                if error is not None:
+                    raise ConstraintError(error)
+
+            self._call({shard: ("commit", (txid,)) for shard in parts})
+
+            committed = True
+        finally:
+            if not committed:
+                self._call({shard: ("abort", (txid,)) for shard in parts})
+
+        if chunk.task in self.taskmap:
+            self.taskmap[chunk.task].append(chunk)
+        else:
+            self.taskmap[chunk.task] = [chunk]
+
+        for node in chunk.proctimes:
+            self.chunkmap[(taskid, chunk.start_time, node)] = chunk
+
+    def remove(self, chunk: "Chunk"):
+        taskid = self._taskid(chunk.task)
+
+        self._call({shard: ("remove", (taskid, chunk.start_time, proctimes))
+                    for shard, proctimes in self._split(chunk.proctimes).items()})
+
+        self.taskmap[chunk.task].remove(chunk)
+
+        for node in chunk.proctimes:
+            del self.chunkmap[(taskid, chunk.start_time, node)]
+
+    def earliest_start_time(self, task: "Task", proctimes: Dict[Any, float], time: float = 0) -> Optional[float]:
+        if ReleaseTimeConstraint in task:
+            time = max(time, task[ReleaseTimeConstraint].release_time)
+
+        taskid = self._taskid(task)
+        constraints = self._node_constraints(task)
+        parts = self._split(proctimes)
+
+        while True:
+            results = self._call({shard: ("earliest", (taskid, task.name, constraints, part, time))
+                                  for shard, part in parts.items()})
+
+            if any(start_time is None for start_time in results.values()):
+                return None
+
+            start_time = max(results.values(), default=time)
+
+            if start_time == time:
+                break
+
+            time = start_time
+
+        if self._isvalid(Chunk(task, time, proctimes)) is not None:
+            return None
+
+        return time
+
+    def earliest_slot(self, task: "Task", ptime: float, time: float = 0,
+                      nodes: Optional[List[Any]] = None) -> Optional[Tuple[float, Any]]:
+        if ReleaseTimeConstraint in task:
+            time = max(time, task[ReleaseTimeConstraint].release_time)
+
+        if nodes is None:
+            nodes = list(self.shardmap)
+
+        if MultipurposeMachinesConstraint in task:
+            nodes = [node for node in nodes if node in task[MultipurposeMachinesConstraint].compatible_nodes]
+
+        if ExecutionNodesConstraint in task:
+            nodes = [node for node in nodes if node in task[ExecutionNodesConstraint].execution_nodes]
+
+        taskid = self._taskid(task)
+        constraints = self._node_constraints(task)
+        parts = {}
+
+        for node in nodes:
+            shard = self.shardmap[node]
+
+            if shard in parts:
+                parts[shard].append(node)
+            else:
+                parts[shard] = [node]
+
+        results = self._call({shard: ("slots", (taskid, task.name, constraints, ptime, part, time))
+                              for shard, part in parts.items()})
+
+        slots = [slot for result in results.values() for slot in result]
+
+        for start_time, node in sorted(slots, key=lambda slot: slot[0]):
+            if self._isvalid(Chunk(task, start_time, {node: ptime})) is None:
+                return start_time, node
+
+        return None
+
+    def get(self, prop: "Property") -> Any:
+        if isinstance(prop, (ChunksAtProperty, ChunksOverProperty)):
+            results = self._call({shard: ("chunks", (prop,)) for shard in range(len(self.conns))})
+
+            chks = set()
+
+            for result in results.values():
+                for key in result:
+                    chks.add(self.chunkmap[key])
+
+            return chks
+        elif isinstance(prop, EarliestStartTimeProperty):
+            return self.earliest_start_time(prop.task, prop.proctimes, prop.time)
+        elif isinstance(prop, (ProcessedTimesProperty, StartTimeProperty, CompletionTimeProperty)):
+            return prop.get(self)
+        else:
+            raise ShardError("'{}' property is not supported on sharded schedules".format(type(prop).__name__))
+
+    def apply(self, operator: "Operator") -> Any:
+        if isinstance(operator, AppendOperator):
+            return self.append(operator.chunk)
+        elif isinstance(operator, RemoveOperator):
+            return self.remove(operator.chunk)
+        else:
+            raise ShardError("'{}' operator is not supported on sharded schedules".format(type(operator).__name__))
@@ -0,0 +1,35 @@
+import json
+from typing import Any, List, Dict, Iterator, Optional
+
+from dstf.core import Schedule
+
+
+def timeline_batches(schedule: "Schedule", lo: float, hi: float, buckets: int = 1000,
+                     nodes: Optional[List[Any]] = None, batchsize: int = 65536) -> Iterator[Dict[str, list]]:
+    width = (hi - lo) / buckets
+
+    if nodes is None:
+        nodes = schedule.nodes()
+
+    batch = {"node": [], "start": [], "end": []}
+
+    for node in nodes:
+        if schedule.hasnode(node):
+            for start, end in schedule.node(node).segments(lo, hi, width):
+                batch["node"].append(node)
+                batch["start"].append(start)
+                batch["end"].append(end)
+
+                if len(batch["node"]) >= batchsize:
+                    yield batch
+
+                    batch = {"node": [], "start": [], "end": []}
+
+    if batch["node"]:
+        yield batch
+
+
+def timeline_json(schedule: "Schedule", lo: float, hi: float, buckets: int = 1000,
+                  nodes: Optional[List[Any]] = None, batchsize: int = 65536) -> Iterator[str]:
+    for batch in timeline_batches(schedule, lo, hi, buckets, nodes, batchsize):
+        yield json.dumps(batch) + "\n"
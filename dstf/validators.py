@@ -0,0 +1,131 @@
+from math import inf
+from operator import attrgetter
+from typing import Iterable, List, Optional
+
+from dstf.constraints import (NoSimultaneousExecutionConstraint, NoMigrationConstraint, ProcessingTimesConstraint,
+                              SetupTimeConstraint)
+from dstf.core import Constraint, Schedule, Chunk
+
+_start_time = attrgetter("start_time")
+
+_SWEPT_CONSTRAINTS = {NoSimultaneousExecutionConstraint, NoMigrationConstraint, ProcessingTimesConstraint,
+                      SetupTimeConstraint}
+
+
+class Violation:
+    def __init__(self, constraint: "Constraint", chunk: "Chunk", message: str):
+        self.constraint = constraint
+        self.chunk = chunk
+        self.message = message
+
+    def __repr__(self) -> str:
+        return "Violation({!r})".format(self.message)
+
+
+class _Violations:
+    def __init__(self, schedule: "Schedule"):
+        self.schedule = schedule
+        self.seen = set()
+        self.violations = []
+
+    def add(self, constraint: "Constraint", chunk: "Chunk"):
+        key = (id(constraint), id(chunk))
+
+        if key not in self.seen:
+            self.seen.add(key)
+            self.violations.append(Violation(constraint, chunk, constraint.geterror(self.schedule, chunk)))
+
+
+def validate(chunks: Iterable["Chunk"], schedule: Optional["Schedule"] = None) -> List["Violation"]:
+    if schedule is None:
+        schedule = Schedule()
+
+    violations = _Violations(schedule)
+
+    taskmap = {}
+    nodemap = {}
+
+    for chk in chunks:
+        if chk.task in taskmap:
+            taskmap[chk.task].append(chk)
+        else:
+            taskmap[chk.task] = [chk]
+
+        for node in chk.proctimes:
+            if node in nodemap:
+                nodemap[node].append(chk)
+            else:
+                nodemap[node] = [chk]
+
+    for task, chks in taskmap.items():
+        chks.sort(key=_start_time)
+
+        no_migration = task.constraints.get(NoMigrationConstraint)
+        processing_times = task.constraints.get(ProcessingTimesConstraint)
+        ctrs = [ctr for cls, ctr in task.constraints.items() if cls not in _SWEPT_CONSTRAINTS]
+
+        processed = {}
+        nodes = None
+
+        for chk in chks:
+            for ctr in ctrs:
+                if not ctr.isvalid(schedule, chk):
+                    violations.add(ctr, chk)
+
+            if no_migration is not None:
+                if nodes is not None and not nodes.issuperset(chk.proctimes):
+                    violations.add(no_migration, chk)
+
+                if nodes is None:
+                    nodes = set(chk.proctimes)
+                else:
+                    nodes.intersection_update(chk.proctimes)
+
+            if processing_times is not None:
+                for node, ptime in chk.proctimes.items():
+                    done = processed.get(node, 0)
+
+                    if ptime - (processing_times.processing_times[node] - done) > schedule.epsilon:
+                        violations.add(processing_times, chk)
+
+                    processed[node] = done + ptime
+
+    for node, chks in nodemap.items():
+        chks.sort(key=_start_time)
+
+        busy = None
+        busy_end = -inf
+        prev = None
+        prev_end = -inf
+
+        for chk in chks:
+            start_time = chk.start_time
+            end = start_time + chk.proctimes[node]
+
+            if start_time < busy_end and busy.start_time < end:
+                if NoSimultaneousExecutionConstraint in chk.task:
+                    violations.add(chk.task[NoSimultaneousExecutionConstraint], chk)
+                elif NoSimultaneousExecutionConstraint in busy.task:
+                    violations.add(busy.task[NoSimultaneousExecutionConstraint], busy)
+
+            if prev is not None:
+                if SetupTimeConstraint in chk.task:
+                    ctr = chk.task[SetupTimeConstraint]
+
+                    if prev_end + ctr.setup_time(prev.task, chk.task) > start_time:
+                        violations.add(ctr, chk)
+
+                if SetupTimeConstraint in prev.task:
+                    ctr = prev.task[SetupTimeConstraint]
+
+                    if prev_end + ctr.setup_time(prev.task, chk.task) > start_time:
+                        violations.add(ctr, prev)
+
+            if end > busy_end:
+                busy = chk
+                busy_end = end
+
+            prev = chk
+            prev_end = end
+
+    return violations.violations
@@ -6,6 +6,7 @@ with open("README.md", "r") as f:
 setuptools.setup(name="dstf",
                  version="0.0.12",
                  packages=setuptools.find_packages(),
+                 extras_require={"numpy": ["numpy"]},
                  url="https://github.com/anthonydugois/dstf",
                  author="Anthony Dugois",
                  author_email="hello@anthonydugois.com",
@@ -0,0 +1,108 @@
+from math import inf
+
+from dstf import *
+from dstf.bounds import LowerBounds
+
+
+def test_makespan__lower_bounds():
+    nodes = ["n{}".format(i) for i in range(2)]
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    sched = Schedule()
+
+    for task, ptime in zip(tasks, [4, 4, 6]):
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(ProcessingTimesConstraint({node: ptime for node in nodes}))
+
+    bounds = LowerBounds(sched, tasks, nodes)
+
+    assert bounds.makespan() == 7
+
+    chunk = Chunk(tasks[2], 0, {nodes[0]: 6})
+
+    bounds.append(chunk)
+
+    assert bounds.makespan() == 7
+    assert bounds.total_completion_time() == 6 + 8
+
+    bounds.append(Chunk(tasks[0], 0, {nodes[1]: 4}))
+
+    assert bounds.makespan() == 7
+    assert bounds.total_completion_time() == 6 + 4 + 4
+
+    bounds.remove(chunk)
+
+    assert bounds.makespan() == 7
+    assert bounds.total_completion_time() == 4 + max((4 * 2 + 6) / 2, 10)
+
+
+def test_load__lower_bounds():
+    nodes = ["n{}".format(i) for i in range(2)]
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    sched = Schedule()
+
+    for task in tasks:
+        task.set(ProcessingTimesConstraint({nodes[0]: 5}))
+
+    bounds = LowerBounds(sched, tasks, nodes)
+
+    assert bounds.load() == 15
+    assert bounds.makespan() == 15
+
+    bounds.append(Chunk(tasks[0], 0, {nodes[0]: 2}))
+
+    assert bounds.load() == 15
+
+
+def test_energy__lower_bounds():
+    node = "n0"
+    tasks = [Task("t{}".format(i)) for i in range(2)]
+    sched = Schedule()
+
+    for task in tasks:
+        task.set(ProcessingTimesConstraint({node: 5}))
+        task.set(ReleaseTimeConstraint(0))
+        task.set(DeadlineConstraint(8))
+
+    bounds = LowerBounds(sched, tasks, [node])
+
+    assert bounds.energy() == inf
+    assert bounds.makespan() == inf
+
+    tasks[1].set(DeadlineConstraint(10))
+
+    bounds = LowerBounds(sched, tasks, [node])
+
+    assert bounds.energy() == 0
+
+    chunk = Chunk(Task("blocker"), 2, {node: 4})
+
+    bounds.append(chunk)
+
+    assert bounds.energy() == inf
+
+    bounds.remove(chunk)
+
+    assert bounds.energy() == 0
+
+
+def test_total_completion_time__lower_bounds_srpt():
+    nodes = ["n{}".format(i) for i in range(2)]
+    tasks = [Task("t{}".format(i)) for i in range(6)]
+    sched = Schedule()
+
+    for task, ptime in zip(tasks, [3, 1, 4, 1, 5, 9]):
+        task.set(ProcessingTimesConstraint({node: ptime for node in nodes}))
+
+    bounds = LowerBounds(sched, tasks, nodes)
+    chunks = [Chunk(tasks[2], 0, {nodes[0]: 2}), Chunk(tasks[5], 0, {nodes[1]: 4})]
+
+    for chunk in chunks:
+        bounds.append(chunk)
+
+    bounds.remove(chunks[0])
+
+    rems = sorted(bounds.remaining[task] for task in tasks if bounds.remaining[task] > 0)
+
+    assert bounds.srpt == sum(rem * (len(rems) - i) for i, rem in enumerate(rems))
+    assert bounds.load() == 4
+    assert bounds.cmax == 4
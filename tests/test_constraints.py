@@ -106,3 +106,24 @@ def test_isvalid__execution_nodes():
     assert not ctr.isvalid(sched, Chunk(task, 0, {nodes[0]: 10, nodes[1]: 10}))
     assert not ctr.isvalid(sched, Chunk(task, 0, {nodes[0]: 10, nodes[1]: 10, nodes[2]: 10, nodes[3]: 10}))
     assert not ctr.isvalid(sched, Chunk(task, 0, {nodes[0]: 10, nodes[1]: 10, nodes[3]: 10}))
+
+
+def test_isvalid__setup_time():
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    node = "n0"
+    sched = Schedule()
+    setup_times = {"a": {"b": 5}, "b": {"a": 2}}
+
+    tasks[0].set(SetupTimeConstraint("a", setup_times))
+    tasks[1].set(SetupTimeConstraint("b", setup_times))
+
+    sched.apply(AppendOperator(Chunk(tasks[0], 0, {node: 10})))
+    sched.apply(AppendOperator(Chunk(tasks[0], 30, {node: 10})))
+
+    ctr = tasks[1][SetupTimeConstraint]
+
+    assert ctr.isvalid(sched, Chunk(tasks[1], 15, {node: 10}))
+    assert ctr.isvalid(sched, Chunk(tasks[1], 15, {node: 13}))
+    assert not ctr.isvalid(sched, Chunk(tasks[1], 14, {node: 10}))
+    assert not ctr.isvalid(sched, Chunk(tasks[1], 15, {node: 14}))
+    assert ctr.isvalid(sched, Chunk(tasks[2], 10, {node: 20}))
@@ -54,3 +54,234 @@ def test_append_to__chunk():
 
     with pytest.raises(ConstraintError):
         chks[2].append_to(sched)
+
+
+def test_predecessor__chunk_tree():
+    task = Task("t0")
+    node = "n0"
+    chks = [Chunk(task, 0, {node: 10}), Chunk(task, 10, {node: 10}), Chunk(task, 20, {node: 10})]
+    tree = ChunkTree(node)
+
+    for chk in chks:
+        tree.add(chk)
+
+    assert tree.predecessor(0) is None
+    assert tree.predecessor(10).chunk == chks[0]
+    assert tree.predecessor(15).chunk == chks[1]
+    assert tree.predecessor(25).chunk == chks[2]
+
+
+def test_successor__chunk_tree():
+    task = Task("t0")
+    node = "n0"
+    chks = [Chunk(task, 0, {node: 10}), Chunk(task, 10, {node: 10}), Chunk(task, 20, {node: 10})]
+    tree = ChunkTree(node)
+
+    for chk in chks:
+        tree.add(chk)
+
+    assert tree.successor(-5).chunk == chks[0]
+    assert tree.successor(0).chunk == chks[1]
+    assert tree.successor(15).chunk == chks[2]
+    assert tree.successor(20) is None
+
+
+def test_get__schedule_cache():
+    tasks = [Task("t{}".format(i)) for i in range(2)]
+    node = "n0"
+    sched = Schedule()
+
+    sched.apply(AppendOperator(Chunk(tasks[0], 0, {node: 10})))
+    sched.apply(AppendOperator(Chunk(tasks[1], 10, {node: 10})))
+
+    processed = sched.get(ProcessedTimesProperty(tasks[0]))
+    chks = sched.get(ChunksOverProperty(0, 20))
+
+    assert sched.get(ProcessedTimesProperty(tasks[0])) is processed
+    assert sched.get(ChunksOverProperty(0, 20)) is chks
+
+    with pytest.raises(TypeError):
+        processed[node] = 0
+
+    with pytest.raises(AttributeError):
+        chks.clear()
+
+    sched.apply(AppendOperator(Chunk(tasks[1], 20, {node: 10})))
+
+    assert sched.get(ProcessedTimesProperty(tasks[0])) is processed
+    assert sched.get(ChunksOverProperty(0, 20)) is not chks
+    assert sched.get(ProcessedTimesProperty(tasks[1])) == {node: 20}
+
+
+def test_get__schedule_cache_size():
+    task = Task("t0")
+    node = "n0"
+    sched = Schedule(cachesize=2)
+
+    sched.apply(AppendOperator(Chunk(task, 0, {node: 10})))
+
+    for time in range(5):
+        sched.get(ChunksAtProperty(time))
+
+    assert len(sched.cache) == 2
+
+
+def test_copy__persistent_chunk_tree():
+    task = Task("t0")
+    node = "n0"
+    tree = ChunkTree(node, persistent=True)
+
+    for i in range(10):
+        tree.add(Chunk(task, i * 10, {node: 10}))
+
+    snapshot = tree.copy()
+
+    for i in range(10, 20):
+        tree.add(Chunk(task, i * 10, {node: 10}))
+
+    tree.remove(tree.min().chunk)
+
+    assert [treenode.chunk.start_time for treenode in snapshot] == [i * 10 for i in range(10)]
+    assert [treenode.chunk.start_time for treenode in tree] == [i * 10 for i in range(1, 20)]
+
+
+def test_get__concurrent_schedule():
+    from concurrent.futures import ThreadPoolExecutor
+
+    node = "n0"
+    sched = Schedule(concurrent=True)
+
+    def write():
+        for i in range(2000):
+            task = Task("t{}".format(i)).set(NoSimultaneousExecutionConstraint())
+
+            sched.apply(AppendOperator(Chunk(task, i, {node: 1})))
+
+    def read():
+        while not done:
+            sched.get(ChunksOverProperty(0, 2000))
+
+            if sched.hasnode(node):
+                times = [treenode.chunk.start_time for treenode in sched.node(node)]
+
+                assert times == sorted(times)
+
+    done = False
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        readers = [executor.submit(read) for _ in range(4)]
+
+        executor.submit(write).result()
+
+        done = True
+
+        for reader in readers:
+            reader.result()
+
+    assert len(sched.get(ChunksOverProperty(0, 2000))) == 2000
+    assert sched.validate() == []
+
+
+def test_append_to__tick_schedule():
+    task = Task("t0")
+    node = "n0"
+    sched = Schedule(resolution=1e-3)
+
+    task.set(ProcessingTimesConstraint({node: sched.totick(0.3)}))
+
+    sched.apply(AppendOperator(Chunk(task, 0, {node: sched.totick(0.1)})))
+    sched.apply(AppendOperator(Chunk(task, sched.totick(0.1), {node: sched.totick(0.2)})))
+
+    assert sched.get(ProcessedTimesProperty(task)) == {node: 300}
+    assert sched.fromtick(sched.get(CompletionTimeProperty(task))) == 0.3
+
+    with pytest.raises(ResolutionError):
+        sched.apply(AppendOperator(Chunk(task, 0.5, {node: 1})))
+
+    with pytest.raises(ConstraintError):
+        sched.apply(AppendOperator(Chunk(task, sched.totick(0.3), {node: 1})))
+
+
+def test_diff__schedule():
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    node = "n0"
+    chks = [Chunk(tasks[0], 0, {node: 10}), Chunk(tasks[1], 10, {node: 10}), Chunk(tasks[2], 20, {node: 10})]
+    sched = Schedule()
+    other = Schedule()
+
+    for chk in chks[:2]:
+        sched.apply(AppendOperator(chk))
+
+    other.apply(AppendOperator(Chunk(tasks[0], 0, {node: 10})))
+    other.apply(AppendOperator(chks[2]))
+
+    operators = sched.diff(other)
+
+    assert [type(operator) for operator in operators] == [RemoveOperator, AppendOperator]
+    assert operators[0].chunk == chks[1]
+    assert operators[1].chunk == chks[2]
+
+    for operator in operators:
+        sched.apply(operator)
+
+    assert sched.diff(other) == []
+
+
+def test_segments__chunk_tree():
+    task = Task("t0")
+    node = "n0"
+    tree = ChunkTree(node)
+
+    for start_time in [0, 10, 25, 27, 40]:
+        tree.add(Chunk(task, start_time, {node: 2 if start_time > 20 else 10}))
+
+    assert tree.segments(0, 50) == [(0, 20), (25, 29), (40, 42)]
+    assert tree.segments(5, 41) == [(5, 20), (25, 29), (40, 41)]
+    assert tree.segments(0, 50, 4) == [(0, 20), (25, 29), (40, 42)]
+    assert tree.segments(0, 50, 5) == [(0, 29), (40, 42)]
+    assert tree.segments(0, 50, 100) == [(0, 42)]
+
+
+def test_segments__chunk_tree_clip():
+    task = Task("t0")
+    node = "n0"
+    tree = ChunkTree(node)
+
+    tree.add(Chunk(task, 2, {node: 1}))
+    tree.add(Chunk(task, 5, {node: 1}))
+
+    assert tree.root.lo == 2
+    assert tree.segments(4, 15, 5) == [(5, 6)]
+    assert tree.segments(0, 15, 5) == [(2, 6)]
+
+
+def test_after__chunk_tree():
+    task = Task("t0")
+    node = "n0"
+    tree = ChunkTree(node)
+
+    for start_time in [0, 5, 5, 10, 15]:
+        tree.add(Chunk(task, start_time, {node: 1}))
+
+    assert [treenode.chunk.start_time for treenode in tree.after(0)] == [5, 5, 10, 15]
+    assert [treenode.chunk.start_time for treenode in tree.after(5)] == [10, 15]
+    assert list(tree.after(15)) == []
+
+
+def test_get__schedule_cache_nodes():
+    task = Task("t0")
+    nodes = ["n{}".format(i) for i in range(2)]
+    sched = Schedule()
+
+    sched.apply(AppendOperator(Chunk(task, 0, {nodes[0]: 10})))
+
+    chks = sched.get(ChunksOverProperty(0, 20, [nodes[0]]))
+
+    sched.apply(AppendOperator(Chunk(task, 5, {nodes[1]: 10})))
+
+    assert sched.get(ChunksOverProperty(0, 20, [nodes[0]])) is chks
+    assert sched.get(ChunksOverProperty(0, 20, [nodes[1]])) != chks
+
+    sched.apply(AppendOperator(Chunk(task, 10, {nodes[0]: 10})))
+
+    assert len(sched.get(ChunksOverProperty(0, 20, [nodes[0]]))) == 2
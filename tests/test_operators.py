@@ -41,3 +41,69 @@ def test_apply__preempt():
     assert sched.task(task)[0].proctimes == {node: 5}
     assert sched.task(task)[1].start_time == 5
     assert sched.task(task)[1].proctimes == {node: 10}
+
+
+def test_apply__repair():
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    outage = Task("outage")
+    nodes = ["n{}".format(i) for i in range(2)]
+    sched = Schedule()
+
+    for task in tasks:
+        task.set(NoSimultaneousExecutionConstraint())
+
+    sched.apply(AppendOperator(Chunk(tasks[0], 0, {nodes[0]: 10})))
+    sched.apply(AppendOperator(Chunk(tasks[1], 10, {nodes[0]: 10})))
+    sched.apply(AppendOperator(Chunk(tasks[2], 10, {nodes[1]: 10})))
+    sched.apply(AppendOperator(Chunk(outage, 5, {nodes[0]: 10})))
+
+    version = sched.taskversion(outage)
+    operators = sched.apply(RepairOperator(5, 15, [nodes[0]]))
+
+    assert [type(operator) for operator in operators] == [RemoveOperator] * 2 + [AppendOperator] * 2
+    assert sched.taskversion(outage) == version
+    assert sched.get(StartTimeProperty(tasks[0])) == 15
+    assert sched.get(StartTimeProperty(tasks[1])) == 25
+    assert sched.get(StartTimeProperty(tasks[2])) == 10
+
+
+def test_apply__repair_unplaced():
+    task = Task("t0")
+    outage = Task("outage")
+    node = "n0"
+    sched = Schedule()
+
+    task.set(NoSimultaneousExecutionConstraint())
+    task.set(DeadlineConstraint(20))
+
+    chk = Chunk(task, 0, {node: 10})
+
+    sched.apply(AppendOperator(chk))
+    sched.apply(AppendOperator(Chunk(outage, 5, {node: 10})))
+
+    repair = RepairOperator(0, 20)
+    operators = sched.apply(repair)
+
+    assert [type(operator) for operator in operators] == [RemoveOperator]
+    assert repair.unplaced == [chk]
+    assert not sched.task(task)
+
+
+def test_apply__repair_same_start():
+    tasks = [Task("t{}".format(i)) for i in range(2)]
+    outage = Task("outage")
+    node = "n0"
+    sched = Schedule()
+
+    for task in tasks:
+        task.set(NoSimultaneousExecutionConstraint())
+
+    sched.apply(AppendOperator(Chunk(tasks[0], 0, {node: 10})))
+    sched.apply(AppendOperator(Chunk(outage, 0, {node: 10})))
+    sched.apply(AppendOperator(Chunk(tasks[1], 20, {node: 10})))
+
+    sched.apply(RepairOperator(0, 10, [node]))
+
+    assert [(treenode.chunk.task, treenode.chunk.start_time) for treenode in sched.node(node)] == \
+           [(outage, 0), (tasks[0], 10), (tasks[1], 20)]
+    assert sched.validate() == []
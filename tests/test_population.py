@@ -0,0 +1,108 @@
+from math import inf
+
+import pytest
+
+from dstf import *
+
+np = pytest.importorskip("numpy")
+
+from dstf.population import PopulationDecoder
+
+
+def test_decode__population():
+    nodes = ["n{}".format(i) for i in range(2)]
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+
+    for task, ptime in zip(tasks, [2, 3, 4]):
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(ProcessingTimesConstraint({node: ptime for node in nodes}))
+
+    tasks[2].set(ReleaseTimeConstraint(1))
+    tasks[0].set(DeadlineConstraint(5))
+
+    decoder = PopulationDecoder(tasks, nodes)
+
+    permutations = np.array([[0, 1, 2], [2, 1, 0], [1, 0, 2]])
+    assignments = np.array([[0, 0, 1], [0, 0, 0], [0, 0, 1]])
+
+    evaluation = decoder.decode(permutations, assignments)
+
+    assert evaluation.start_times.tolist() == [[0, 2, 1], [8, 5, 1], [3, 0, 1]]
+    assert evaluation.makespan.tolist() == [5, 10, 5]
+    assert evaluation.feasible.tolist() == [True, False, True]
+    assert evaluation.elite(2).tolist() == [0, 2]
+    assert evaluation.total_completion_time.tolist() == [12, 23, 13]
+    assert evaluation.elite(1, "total_completion_time").tolist() == [0]
+
+
+def test_decode__population_execution_size():
+    nodes = ["n{}".format(i) for i in range(3)]
+    tasks = [Task("t{}".format(i)) for i in range(2)]
+
+    for task in tasks:
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(ProcessingTimesConstraint({node: 2 for node in nodes}))
+        task.set(MultipurposeMachinesConstraint(nodes[:2]))
+
+    tasks[0].set(ExecutionSizeConstraint(2))
+
+    decoder = PopulationDecoder(tasks, nodes)
+
+    permutations = np.array([[0, 1], [0, 1], [1, 0]])
+    assignments = np.array([[[0, 1], [1, 0]], [[0, 0], [1, 0]], [[0, 2], [0, 0]]])
+
+    evaluation = decoder.decode(permutations, assignments)
+
+    assert evaluation.start_times.tolist() == [[0, 2], [0, 0], [2, 0]]
+    assert evaluation.feasible.tolist() == [True, False, False]
+
+    with pytest.raises(ValueError):
+        decoder.decode(permutations, assignments[:, :, 0])
+
+
+def test_schedule__population():
+    nodes = ["n{}".format(i) for i in range(2)]
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+
+    for task in tasks:
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(ProcessingTimesConstraint({node: 2 for node in nodes}))
+
+    decoder = PopulationDecoder(tasks, nodes)
+    sched = decoder.schedule(np.array([2, 0, 1]), np.array([0, 1, 0]))
+
+    assert sched.get(CompletionTimeProperty(tasks[0])) == 4
+    assert sched.validate() == []
+
+
+def test_decode__population_ticks():
+    node = "n0"
+    tasks = [Task("t{}".format(i)) for i in range(2)]
+
+    for task, ptime in zip(tasks, [3, 4]):
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(ProcessingTimesConstraint({node: ptime}))
+
+    decoder = PopulationDecoder(tasks, [node], resolution=1)
+    evaluation = decoder.decode(np.array([[0, 1], [1, 0]]), np.zeros((2, 2), dtype=int))
+
+    assert evaluation.completion_times.dtype == np.int64
+    assert evaluation.makespan.tolist() == [7, 7]
+    assert decoder.schedule(np.array([1, 0]), np.array([0, 0])).validate() == []
+
+
+def test_init__population_ticks():
+    node = "n0"
+    task = Task("t0")
+
+    task.set(ProcessingTimesConstraint({node: 3}))
+    task.set(DeadlineConstraint(inf))
+
+    decoder = PopulationDecoder([task], [node], resolution=1)
+
+    assert decoder.deadlines.tolist() == [decoder.highest]
+
+    task.set(ReleaseTimeConstraint(0.5))
+
+    with pytest.raises(ResolutionError):
+        PopulationDecoder([task], [node], resolution=1)
@@ -36,3 +36,16 @@ def test_get__completion_time():
     assert sched.get(CompletionTimeProperty(tasks[0])) == 1
     assert sched.get(CompletionTimeProperty(tasks[1])) == 1
     assert sched.get(CompletionTimeProperty(tasks[2])) is None
+
+
+def test_get__timeline():
+    nodes = ["n{}".format(i) for i in range(2)]
+    task = Task("t0")
+    sched = Schedule()
+
+    sched.apply(AppendOperator(Chunk(task, 0, {nodes[0]: 10})))
+    sched.apply(AppendOperator(Chunk(task, 10, {nodes[0]: 5, nodes[1]: 5})))
+    sched.apply(AppendOperator(Chunk(task, 20, {nodes[1]: 5})))
+
+    assert sched.get(TimelineProperty(0, 30)) == {nodes[0]: ((0, 15),), nodes[1]: ((10, 15), (20, 25))}
+    assert sched.get(TimelineProperty(0, 30, 5)) == {nodes[0]: ((0, 15),), nodes[1]: ((10, 25),)}
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+import pytest
+
+from dstf import *
+from dstf.service import ScheduleService, generate_load
+
+
+def test_apply__service():
+    task = Task("t0")
+    node = "n0"
+    sched = Schedule(concurrent=True)
+
+    task.set(NoSimultaneousExecutionConstraint())
+
+    async def run():
+        async with ScheduleService(sched) as service:
+            snapshot = service.snapshot
+
+            await service.apply(AppendOperator(Chunk(task, 0, {node: 10})))
+
+            assert await service.get(CompletionTimeProperty(task)) == 10
+            assert await service.get(EarliestStartTimeProperty(task, {node: 5})) == 10
+            assert snapshot.get(CompletionTimeProperty(task)) is None
+            assert service.snapshot.nodemap[node].root is sched.nodemap[node].root
+
+            processed = await service.get(ProcessedTimesProperty(task))
+
+            await service.apply(AppendOperator(Chunk(Task("t1"), 20, {node: 5})))
+
+            assert await service.get(ProcessedTimesProperty(task)) is processed
+
+    asyncio.run(run())
+
+
+def test_generate_load__service():
+    node = "n0"
+    sched = Schedule(concurrent=True)
+
+    async def run():
+        async with ScheduleService(sched) as service:
+            return await generate_load(service,
+                                       lambda i: ChunksAtProperty(i),
+                                       lambda i: AppendOperator(Chunk(Task("t{}".format(i)), i, {node: 1})),
+                                       requests=200,
+                                       concurrency=8,
+                                       write_ratio=0.5,
+                                       seed=0)
+
+    report = asyncio.run(run())
+
+    assert report.requests == 200
+    assert report.errors == 0
+    assert report.p99 >= report.p50
+    assert len(sched.task(next(sched.tasks()))) == 1
+
+
+def test_get__service_during_write():
+    task = Task("t0")
+    node = "n0"
+    sched = Schedule(concurrent=True)
+    event = threading.Event()
+
+    class BlockingOperator(Operator):
+        def apply(self, schedule: "Schedule"):
+            event.wait(1)
+
+            Chunk(task, 0, {node: 10}).append_to(schedule)
+
+    async def run():
+        async with ScheduleService(sched) as service:
+            write = asyncio.ensure_future(service.apply(BlockingOperator()))
+
+            await asyncio.sleep(0.01)
+
+            assert await service.get(CompletionTimeProperty(task)) is None
+            assert not write.done()
+
+            event.set()
+
+            await write
+
+            assert await service.get(CompletionTimeProperty(task)) == 10
+
+    asyncio.run(run())
+
+
+def test_stop__service_not_started():
+    asyncio.run(ScheduleService(Schedule(concurrent=True)).stop())
+
+
+def test_init__service_not_concurrent():
+    with pytest.raises(Error):
+        ScheduleService(Schedule())
@@ -0,0 +1,110 @@
+import pytest
+
+from dstf import *
+from dstf.sharding import ShardError, ShardedSchedule
+
+
+def test_append__sharded_schedule():
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    nodes = ["n{}".format(i) for i in range(4)]
+
+    for task in tasks:
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(ExecutionSizeConstraint(2))
+
+    with ShardedSchedule(nodes, shards=2) as sched:
+        chks = [Chunk(tasks[0], 0, {nodes[0]: 10, nodes[1]: 10}), Chunk(tasks[1], 5, {nodes[1]: 10, nodes[2]: 10})]
+
+        sched.apply(AppendOperator(chks[0]))
+
+        with pytest.raises(ConstraintError):
+            sched.apply(AppendOperator(chks[1]))
+
+        with pytest.raises(ConstraintError):
+            sched.apply(AppendOperator(Chunk(tasks[1], 20, {nodes[2]: 10})))
+
+        assert sched.get(ChunksAtProperty(5)) == {chks[0]}
+        assert sched.get(CompletionTimeProperty(tasks[0])) == 10
+
+        sched.apply(AppendOperator(Chunk(tasks[1], 5, {nodes[2]: 10, nodes[3]: 10})))
+
+        assert len(sched.get(ChunksOverProperty(0, 20))) == 2
+
+        sched.apply(RemoveOperator(chks[0]))
+
+        assert sched.get(ChunksAtProperty(5)) != {chks[0]}
+
+
+def test_earliest__sharded_schedule():
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    nodes = ["n{}".format(i) for i in range(4)]
+
+    for task in tasks:
+        task.set(NoSimultaneousExecutionConstraint())
+
+    with ShardedSchedule(nodes, shards=2) as sched:
+        sched.apply(AppendOperator(Chunk(tasks[0], 0, {nodes[0]: 10, nodes[2]: 5})))
+        sched.apply(AppendOperator(Chunk(tasks[1], 0, {nodes[1]: 20, nodes[3]: 3})))
+
+        assert sched.earliest_start_time(tasks[2], {nodes[0]: 5, nodes[1]: 5}) == 20
+        assert sched.earliest_start_time(tasks[2], {nodes[2]: 5, nodes[3]: 5}) == 5
+        assert sched.earliest_slot(tasks[2], 5) == (3, nodes[3])
+        assert sched.earliest_slot(tasks[2], 5, nodes=nodes[:2]) == (10, nodes[0])
+        assert sched.get(EarliestStartTimeProperty(tasks[2], {nodes[0]: 5, nodes[1]: 5})) == 20
+
+        with pytest.raises(ShardError):
+            sched.get(TimelineProperty(0, 20))
+
+        task = Task("t3")
+
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(ExecutionNodesConstraint([nodes[1]]))
+
+        assert sched.earliest_slot(task, 5) == (20, nodes[1])
+
+        task = Task("t4")
+
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(NoMigrationConstraint())
+
+        sched.apply(AppendOperator(Chunk(task, 30, {nodes[0]: 1})))
+
+        assert sched.earliest_slot(task, 5) == (10, nodes[0])
+
+
+def test_append__sharded_schedule_same_name():
+    tasks = [Task("t0"), Task("t0")]
+    nodes = ["n{}".format(i) for i in range(2)]
+    setup_times = {"a": {"b": 5}}
+
+    tasks[0].set(SetupTimeConstraint("a", setup_times))
+    tasks[1].set(SetupTimeConstraint("b", setup_times))
+
+    with ShardedSchedule(nodes, shards=2) as sched:
+        chk = Chunk(tasks[0], 0, {nodes[0]: 10})
+
+        sched.apply(AppendOperator(chk))
+
+        with pytest.raises(ConstraintError):
+            sched.apply(AppendOperator(Chunk(tasks[1], 10, {nodes[0]: 5})))
+
+        assert sched.earliest_start_time(tasks[1], {nodes[0]: 5}, 10) == 15
+        assert sched.get(ChunksAtProperty(5)) == {chk}
+
+
+def test_append__sharded_schedule_shard_error():
+    tasks = [Task("t{}".format(i)) for i in range(2)]
+    nodes = ["n{}".format(i) for i in range(2)]
+
+    for task in tasks:
+        task.set(SetupTimeConstraint("a", {"a": {"a": None}}))
+
+    with ShardedSchedule(nodes, shards=2) as sched:
+        chk = Chunk(tasks[0], 0, {nodes[0]: 10})
+
+        sched.apply(AppendOperator(chk))
+
+        with pytest.raises(ShardError):
+            sched.apply(AppendOperator(Chunk(tasks[1], 20, {nodes[0]: 10, nodes[1]: 10})))
+
+        assert sched.get(ChunksOverProperty(0, 30)) == {chk}
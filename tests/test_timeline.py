@@ -0,0 +1,32 @@
+import json
+
+from dstf import *
+from dstf.timeline import timeline_batches, timeline_json
+
+
+def test_timeline_batches():
+    nodes = ["n{}".format(i) for i in range(2)]
+    task = Task("t0")
+    sched = Schedule()
+
+    for i in range(10):
+        sched.apply(AppendOperator(Chunk(task, i * 10, {nodes[i % 2]: 1})))
+
+    batches = list(timeline_batches(sched, 0, 100, buckets=100, batchsize=4))
+
+    assert [len(batch["node"]) for batch in batches] == [4, 4, 2]
+    assert batches[0] == {"node": [nodes[0]] * 4, "start": [0, 20, 40, 60], "end": [1, 21, 41, 61]}
+
+    batches = list(timeline_batches(sched, 0, 100, buckets=5))
+
+    assert batches == [{"node": nodes, "start": [0, 10], "end": [81, 91]}]
+
+
+def test_timeline_json():
+    node = "n0"
+    task = Task("t0")
+    sched = Schedule()
+
+    sched.apply(AppendOperator(Chunk(task, 0, {node: 10})))
+
+    assert [json.loads(line) for line in timeline_json(sched, 0, 20)] == [{"node": [node], "start": [0], "end": [10]}]
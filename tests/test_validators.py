@@ -0,0 +1,63 @@
+from dstf import *
+
+
+def test_validate__valid():
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    node = "n0"
+
+    for task in tasks:
+        task.set(NoSimultaneousExecutionConstraint())
+        task.set(ProcessingTimesConstraint({node: 10}))
+
+    chks = [Chunk(tasks[0], 0, {node: 10}), Chunk(tasks[1], 10, {node: 5}), Chunk(tasks[1], 15, {node: 5})]
+
+    assert validate(chks) == []
+
+
+def test_validate__violations():
+    tasks = [Task("t{}".format(i)) for i in range(3)]
+    nodes = ["n{}".format(i) for i in range(2)]
+
+    tasks[0].set(NoSimultaneousExecutionConstraint())
+    tasks[1].set(NoSimultaneousExecutionConstraint())
+    tasks[1].set(ProcessingTimesConstraint({nodes[0]: 10}))
+    tasks[2].set(NoMigrationConstraint())
+    tasks[2].set(ReleaseTimeConstraint(5))
+
+    chks = [Chunk(tasks[0], 0, {nodes[0]: 10}),
+            Chunk(tasks[1], 5, {nodes[0]: 10}),
+            Chunk(tasks[1], 15, {nodes[0]: 5}),
+            Chunk(tasks[2], 0, {nodes[1]: 5}),
+            Chunk(tasks[2], 5, {nodes[0]: 5})]
+
+    violations = validate(chks)
+
+    assert {(type(v.constraint), v.chunk) for v in violations} == {(NoSimultaneousExecutionConstraint, chks[1]),
+                                                                     (ProcessingTimesConstraint, chks[2]),
+                                                                     (NoMigrationConstraint, chks[4]),
+                                                                     (ReleaseTimeConstraint, chks[3])}
+
+
+def test_validate__setup_time():
+    tasks = [Task("t{}".format(i)) for i in range(2)]
+    node = "n0"
+    setup_times = {"a": {"b": 5}}
+
+    tasks[0].set(SetupTimeConstraint("a", setup_times))
+    tasks[1].set(SetupTimeConstraint("b", setup_times))
+
+    assert validate([Chunk(tasks[0], 0, {node: 10}), Chunk(tasks[1], 15, {node: 10})]) == []
+    assert len(validate([Chunk(tasks[0], 0, {node: 10}), Chunk(tasks[1], 12, {node: 10})])) == 2
+
+
+def test_validate__schedule():
+    task = Task("t0")
+    node = "n0"
+    sched = Schedule()
+
+    task.set(NoSimultaneousExecutionConstraint())
+
+    sched.apply(AppendOperator(Chunk(task, 0, {node: 10})))
+    sched.apply(AppendOperator(Chunk(task, 10, {node: 10})))
+
+    assert sched.validate() == []